@@ -1,12 +1,39 @@
 name = "sec_api"
+
+# Shared HTTP transport (connection pooling, rate limiting, retries)
+from sec_api.transport import Transport
+from sec_api.transport import get_default_transport
+from sec_api.transport import set_default_transport
+from sec_api.transport import RateLimiter
+from sec_api.transport import set_rate_limits
+from sec_api.transport import RetryPolicy
+
+# JSON decoding of API responses
+from sec_api.decoding import set_json_decoder
+
+# Typed record models for high-volume responses
+from sec_api.models import InsiderTransaction
+from sec_api.models import Holding13F
+from sec_api.models import NportHolding
+from sec_api.models import NpxVote
+
+# Response caches
+from sec_api.cache import DiskCache
+from sec_api.cache import TTLCache
+
 from sec_api.index import QueryApi
 from sec_api.index import FullTextSearchApi
 from sec_api.index import RenderApi
 from sec_api.index import PdfGeneratorApi
+from sec_api.stream import StreamApi
 
 # Extractor & Converter APIs
 from sec_api.index import XbrlApi
 from sec_api.index import ExtractorApi
+from sec_api.xbrl import flatten_xbrl
+from sec_api.xbrl import xbrl_to_arrow
+from sec_api.xbrl import xbrl_to_pandas
+from sec_api.xbrl import XbrlPanel
 
 # Ownership APIs
 from sec_api.index import InsiderTradingApi
@@ -54,3 +81,25 @@ from sec_api.index import SroFilingsApi
 # Other APIs
 from sec_api.index import EdgarEntitiesApi
 from sec_api.index import MappingApi
+from sec_api.mapping_index import MappingIndex
+
+# Bulk export of search API results
+from sec_api.bulk import BulkExporter
+from sec_api.bulk import WindowExceededError
+
+# Incremental sync of new search API results
+from sec_api.sync import IncrementalSync
+from sec_api.sync import SyncState
+
+# Local filing metadata store
+from sec_api.store import FilingStore
+
+# 13F holdings analytics
+from sec_api.holdings import HoldingsStore
+
+# Insider trading analytics
+from sec_api.insider import InsiderTransactionStore
+from sec_api.insider import iter_transactions
+
+# N-PORT holdings loader
+from sec_api.nport import NportLoader
@@ -0,0 +1,642 @@
+"""
+Asyncio versions of all sec-api wrappers.
+
+Requires aiohttp: pip install sec-api[aio]
+
+    import asyncio
+    from sec_api.aio import AsyncTransport, AsyncExtractorApi
+
+    async def main(urls):
+        async with AsyncTransport(max_concurrency=200) as transport:
+            extractorApi = AsyncExtractorApi("YOUR_API_KEY", transport=transport)
+            tasks = [extractorApi.get_section(url, "1A", "text") for url in urls]
+            return await asyncio.gather(*tasks)
+"""
+
+import asyncio
+import re
+import time
+
+from sec_api.index import (
+    handle_api_error,
+    query_api_endpoint,
+    full_text_search_api_endpoint,
+    filing_download_api_endpoint,
+    pdf_generator_api_endpoint,
+    xbrl_api_endpoint,
+    extractor_api_endpoint,
+    form_adv_endpoint,
+    insider_api_endpoint,
+    form_144_api_endpoint,
+    form_13F_holdings_endpoint,
+    form_13F_cover_pages_endpoint,
+    form_nport_api_endpoint,
+    form_13D_13G_endpoint,
+    form_NCEN_endpoint,
+    form_NPX_endpoint,
+    form_S1_424B4_endpoint,
+    form_d_api_endpoint,
+    form_C_endpoint,
+    reg_A_search_all_endpoint,
+    form_1A_endpoint,
+    form_1K_endpoint,
+    form_1Z_endpoint,
+    form_8K_item_4_02_api_endpoint,
+    form_8K_item_x_api_endpoint,
+    exec_comp_api_endpoint,
+    directors_board_members_api_endpoint,
+    float_api_endpoint,
+    subsidiary_endpoint,
+    sec_enforcement_actions,
+    sec_litigations_search_endpoint,
+    sec_administrative_proceedings_endpoint,
+    aaer_search_endpoint,
+    sro_search_endpoint,
+    mapping_api_endpoint,
+    edgar_entities_endpoint,
+)
+from sec_api.decoding import loads
+from sec_api.transport import default_retry_policy, get_default_rate_limiter
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "sec_api.aio requires aiohttp. Install it with: pip install aiohttp"
+        )
+    return aiohttp
+
+
+class AsyncResponse:
+    """
+    Fully read HTTP response, mirrors the parts of requests.Response
+    used by the API wrappers.
+    """
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return loads(self.content)
+
+
+class AsyncTransport:
+    """
+    Shared asyncio HTTP transport with connection pooling and
+    bounded concurrency.
+
+    limit: max. number of open connections
+    limit_per_host: max. number of open connections per host (0 = no limit)
+    max_concurrency: max. number of in-flight requests
+    rate_limiter: RateLimiter applied to every request, defaults to the
+        process-wide rate limiter shared with the synchronous API classes
+    retry_policy: RetryPolicy applied to every request
+
+    Every event loop gets its own aiohttp session. A session is closed when
+    asyncio.run() shuts down its loop, or when the transport is used from
+    another loop. Call close() to release connections earlier.
+    """
+
+    def __init__(
+        self,
+        limit=100,
+        limit_per_host=0,
+        max_concurrency=100,
+        rate_limiter=None,
+        retry_policy=None,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter if rate_limiter else get_default_rate_limiter()
+        self.retry_policy = retry_policy if retry_policy else default_retry_policy
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+        self._closer = None
+
+    async def _get_session(self):
+        loop = asyncio.get_running_loop()
+
+        # aiohttp sessions are bound to the loop they were created in
+        if self._session is None or self._session.closed or self._loop is not loop:
+            await self._discard_session()
+            aiohttp = _import_aiohttp()
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+            # asyncio.run() closes unfinished async generators before it
+            # closes the loop, which closes the session with it
+            self._closer = self._close_at_shutdown(self._session)
+            await self._closer.__anext__()
+
+        return self._session
+
+    async def _close_at_shutdown(self, session):
+        try:
+            yield
+        finally:
+            await session.close()
+
+    async def _discard_session(self):
+        """
+        Closes a session left open by another event loop
+        """
+        session, loop = self._session, self._loop
+        self._session = None
+        if session is None or session.closed:
+            return
+        if loop.is_closed():
+            # the connections went down with the loop, mark it as closed
+            await session.close()
+        else:
+            # runs on the session's own loop, the next time it runs
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def request(
+        self, method, url, proxies=None, retry_statuses=(), max_retries=None, **kwargs
+    ):
+        """
+        Sends a request and retries it according to the retry policy.
+        Returns the last response, which may have a retryable status
+        code if all retries failed.
+        """
+        aiohttp = _import_aiohttp()
+        session = await self._get_session()
+        policy = self.retry_policy
+        retry_statuses = policy.retry_statuses + tuple(retry_statuses)
+        started_at = time.monotonic()
+        retry = 0
+
+        proxy = None
+        if proxies:
+            proxy = proxies.get("https" if url.startswith("https") else "http")
+
+        while True:
+            await self.rate_limiter.acquire_async(url)
+            try:
+                async with self._semaphore:
+                    async with session.request(method, url, proxy=proxy, **kwargs) as r:
+                        content = await r.read()
+                        response = AsyncResponse(r.status, r.headers, content)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                backoff = None
+                if policy.retry_errors:
+                    backoff = policy.next_backoff(
+                        retry, started_at, max_retries=max_retries
+                    )
+                if backoff is None:
+                    raise
+            else:
+                if response.status_code not in retry_statuses:
+                    return response
+                backoff = policy.next_backoff(
+                    retry, started_at, response.headers, max_retries
+                )
+                if backoff is None:
+                    return response
+
+            await asyncio.sleep(backoff)
+            retry += 1
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+_default_transport = None
+
+
+def get_default_async_transport():
+    """
+    Returns the process-wide async transport used by all async API
+    classes that are created without an explicit transport.
+    """
+    global _default_transport
+
+    if _default_transport is None:
+        _default_transport = AsyncTransport()
+
+    return _default_transport
+
+
+def set_default_async_transport(transport):
+    global _default_transport
+    _default_transport = transport
+
+
+class _AsyncApi:
+    def __init__(self, api_key, proxies=None, transport=None):
+        self.api_key = api_key
+        self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_async_transport()
+
+    async def _request(self, method, url, query=None, **kwargs):
+        if method == "POST":
+            response = await self.transport.post(
+                url, json=query, proxies=self.proxies, **kwargs
+            )
+        else:
+            response = await self.transport.get(url, proxies=self.proxies, **kwargs)
+
+        if response.status_code == 200:
+            return response
+        handle_api_error(response)
+
+
+class _AsyncSearchApi(_AsyncApi):
+    """
+    Base class for all APIs that are queried with POST get_data(query)
+    """
+
+    endpoint = ""
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = self.endpoint + "?token=" + api_key
+
+    async def get_data(self, query):
+        response = await self._request("POST", self.api_endpoint, query)
+        return response.json()
+
+
+class AsyncQueryApi(_AsyncApi):
+    """
+    Async version of QueryApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = query_api_endpoint + "?token=" + api_key
+
+    async def get_filings(self, query):
+        response = await self._request("POST", self.api_endpoint, query)
+        return response.json()
+
+
+class AsyncFullTextSearchApi(_AsyncApi):
+    """
+    Async version of FullTextSearchApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = full_text_search_api_endpoint + "?token=" + api_key
+
+    async def get_filings(self, query):
+        response = await self._request("POST", self.api_endpoint, query)
+        return response.json()
+
+
+class AsyncRenderApi(_AsyncApi):
+    """
+    Async version of RenderApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = filing_download_api_endpoint
+
+    def _file_url(self, url):
+        # remove "ix?doc=/" from URL
+        filename = re.sub(r"ix\?doc=/", "", url)
+        filename = re.sub(r"https://www.sec.gov/Archives/edgar/data", "", filename)
+        return self.api_endpoint + filename + "?token=" + self.api_key
+
+    async def get_filing(self, url, return_binary=False):
+        response = await self._request("GET", self._file_url(url))
+        return response.text if not return_binary else response.content
+
+    async def get_file(self, url, return_binary=False):
+        response = await self._request("GET", self._file_url(url))
+        return response.text if not return_binary else response.content
+
+
+class AsyncPdfGeneratorApi(_AsyncApi):
+    """
+    Async version of PdfGeneratorApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = pdf_generator_api_endpoint
+
+    async def get_pdf(self, url):
+        file_url = re.sub(r"ix\?doc=/", "", url)
+        _url = (
+            self.api_endpoint + "?type=pdf&url=" + file_url + "&token=" + self.api_key
+        )
+        response = await self._request("GET", _url, retry_statuses=(202,))
+        return response.content
+
+
+class AsyncXbrlApi(_AsyncApi):
+    """
+    Async version of XbrlApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = xbrl_api_endpoint + "?token=" + api_key
+
+    async def xbrl_to_json(self, htm_url="", xbrl_url="", accession_no=""):
+        if len(htm_url) == 0 and len(xbrl_url) == 0 and len(accession_no) == 0:
+            raise ValueError("htm_url, xbrl_url or accession_no must be present")
+
+        _url = ""
+
+        if len(htm_url):
+            _url = self.api_endpoint + "&htm-url=" + htm_url
+
+        if len(xbrl_url):
+            _url = self.api_endpoint + "&xbrl-url=" + xbrl_url
+
+        if len(accession_no):
+            _url = self.api_endpoint + "&accession-no=" + accession_no
+
+        response = await self._request("GET", _url)
+        return response.json()
+
+
+class AsyncExtractorApi(_AsyncApi):
+    """
+    Async version of ExtractorApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = extractor_api_endpoint + "?token=" + api_key
+
+    async def get_section(self, filing_url="", section="1A", return_type="text"):
+        if len(filing_url) == 0:
+            raise ValueError("filing_url must be present")
+
+        _url = (
+            self.api_endpoint
+            + "&url="
+            + filing_url
+            + "&item="
+            + section
+            + "&type="
+            + return_type
+        )
+        response = await self._request("GET", _url, max_retries=5)
+        return response.text
+
+
+class AsyncMappingApi(_AsyncApi):
+    """
+    Async version of MappingApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = mapping_api_endpoint
+        self.supported_parameters = [
+            "cik",
+            "ticker",
+            "cusip",
+            "name",
+            "exchange",
+            "sector",
+            "industry",
+        ]
+
+    async def resolve(self, parameter="", value=""):
+        if not parameter.lower() in self.supported_parameters:
+            raise ValueError("Parameter not supported")
+
+        _url = (
+            self.api_endpoint
+            + "/"
+            + parameter.lower()
+            + "/"
+            + value
+            + "?token="
+            + self.api_key
+        )
+        response = await self._request("GET", _url)
+        return response.json()
+
+
+class AsyncExecCompApi(_AsyncApi):
+    """
+    Async version of ExecCompApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = exec_comp_api_endpoint
+
+    async def get_data(self, parameter=""):
+        if isinstance(parameter, str):
+            _url = (
+                self.api_endpoint + "/" + parameter.upper() + "?token=" + self.api_key
+            )
+            response = await self._request("GET", _url)
+        elif isinstance(parameter, dict):
+            _url = self.api_endpoint + "?token=" + self.api_key
+            response = await self._request("POST", _url, parameter)
+        else:
+            raise Exception("Invalid parameter")
+
+        return response.json()
+
+
+class AsyncFormAdvApi(_AsyncApi):
+    """
+    Async version of FormAdvApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint_firm = form_adv_endpoint + "/firm" + "?token=" + api_key
+        self.api_endpoint_individual = (
+            form_adv_endpoint + "/individual" + "?token=" + api_key
+        )
+        self.api_endpoint_brochures = form_adv_endpoint + "/brochures?token=" + api_key
+
+    async def get_firms(self, query):
+        response = await self._request("POST", self.api_endpoint_firm, query)
+        return response.json()
+
+    async def get_individuals(self, query):
+        response = await self._request("POST", self.api_endpoint_individual, query)
+        return response.json()
+
+    async def _get_schedule(self, path, crd):
+        api_endpoint = form_adv_endpoint + path + str(crd) + "?token=" + self.api_key
+        response = await self._request("GET", api_endpoint)
+        return response.json()
+
+    async def get_direct_owners(self, crd):
+        return await self._get_schedule("/schedule-a-direct-owners/", crd)
+
+    async def get_indirect_owners(self, crd):
+        return await self._get_schedule("/schedule-b-indirect-owners/", crd)
+
+    async def get_private_funds(self, crd):
+        return await self._get_schedule("/schedule-d-7-b-1/", crd)
+
+    async def get_brochures(self, crd):
+        return await self._get_schedule("/brochures/", crd)
+
+
+class AsyncFloatApi(_AsyncApi):
+    """
+    Async version of FloatApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint = float_api_endpoint + "?token=" + api_key
+
+    async def get_float(self, ticker="", cik=""):
+        if len(ticker) == 0 and len(cik) == 0:
+            raise Exception("Invalid input")
+
+        search_term = "&ticker=" + ticker if len(ticker) else "&cik=" + cik
+        response = await self._request("GET", self.api_endpoint + search_term)
+        return response.json()
+
+
+class AsyncFormNPXApi(_AsyncApi):
+    """
+    Async version of FormNPXApi
+    """
+
+    def __init__(self, api_key, proxies=None, transport=None):
+        super().__init__(api_key, proxies=proxies, transport=transport)
+        self.api_endpoint_metadata = form_NPX_endpoint + "?token=" + api_key
+        self.api_endpoint_records = (
+            form_NPX_endpoint + "/<accessionNo>?token=" + api_key
+        )
+
+    async def get_metadata(self, query):
+        response = await self._request("POST", self.api_endpoint_metadata, query)
+        return response.json()
+
+    async def get_voting_records(self, accessionNo):
+        api_endpoint = self.api_endpoint_records.replace("<accessionNo>", accessionNo)
+        response = await self._request("GET", api_endpoint)
+        return response.json()
+
+
+class AsyncDirectorsBoardMembersApi(_AsyncSearchApi):
+    endpoint = directors_board_members_api_endpoint
+
+
+class AsyncInsiderTradingApi(_AsyncSearchApi):
+    endpoint = insider_api_endpoint
+
+
+class AsyncForm144Api(_AsyncSearchApi):
+    endpoint = form_144_api_endpoint
+
+
+class AsyncForm13FHoldingsApi(_AsyncSearchApi):
+    endpoint = form_13F_holdings_endpoint
+
+
+class AsyncForm13FCoverPagesApi(_AsyncSearchApi):
+    endpoint = form_13F_cover_pages_endpoint
+
+
+class AsyncFormNportApi(_AsyncSearchApi):
+    endpoint = form_nport_api_endpoint
+
+
+class AsyncForm13DGApi(_AsyncSearchApi):
+    endpoint = form_13D_13G_endpoint
+
+
+class AsyncFormNcenApi(_AsyncSearchApi):
+    endpoint = form_NCEN_endpoint
+
+
+class AsyncForm_S1_424B4_Api(_AsyncSearchApi):
+    endpoint = form_S1_424B4_endpoint
+
+
+class AsyncFormCApi(_AsyncSearchApi):
+    endpoint = form_C_endpoint
+
+
+class AsyncFormDApi(_AsyncSearchApi):
+    endpoint = form_d_api_endpoint
+
+
+class AsyncRegASearchAllApi(_AsyncSearchApi):
+    endpoint = reg_A_search_all_endpoint
+
+
+class AsyncForm1AApi(_AsyncSearchApi):
+    endpoint = form_1A_endpoint
+
+
+class AsyncForm1KApi(_AsyncSearchApi):
+    endpoint = form_1K_endpoint
+
+
+class AsyncForm1ZApi(_AsyncSearchApi):
+    endpoint = form_1Z_endpoint
+
+
+class AsyncItem_4_02_Api(_AsyncSearchApi):
+    endpoint = form_8K_item_4_02_api_endpoint
+
+
+class AsyncForm_8K_Item_X_Api(_AsyncSearchApi):
+    endpoint = form_8K_item_x_api_endpoint
+
+
+class AsyncSubsidiaryApi(_AsyncSearchApi):
+    endpoint = subsidiary_endpoint
+
+
+class AsyncSecEnforcementActionsApi(_AsyncSearchApi):
+    endpoint = sec_enforcement_actions
+
+
+class AsyncSecLitigationsApi(_AsyncSearchApi):
+    endpoint = sec_litigations_search_endpoint
+
+
+class AsyncSecAdministrativeProceedingsApi(_AsyncSearchApi):
+    endpoint = sec_administrative_proceedings_endpoint
+
+
+class AsyncAaerApi(_AsyncSearchApi):
+    endpoint = aaer_search_endpoint
+
+
+class AsyncSroFilingsApi(_AsyncSearchApi):
+    endpoint = sro_search_endpoint
+
+
+class AsyncEdgarEntitiesApi(_AsyncSearchApi):
+    endpoint = edgar_entities_endpoint
@@ -0,0 +1,463 @@
+"""
+Bulk export of entire result sets of the search APIs, e.g. InsiderTradingApi,
+Form13FHoldingsApi, FormNportApi, Form13DGApi, FormDApi, SubsidiaryApi,
+SecEnforcementActionsApi or EdgarEntitiesApi.
+
+    from sec_api import InsiderTradingApi, BulkExporter
+
+    insiderTradingApi = InsiderTradingApi("YOUR_API_KEY")
+    exporter = BulkExporter(insiderTradingApi, checkpoint_path="form4.checkpoint")
+    exporter.export(
+        {"query": "issuer.tradingSymbol:TSLA"},
+        "form4.jsonl",
+        start="2015-01-01",
+        end="2024-12-31",
+    )
+"""
+
+import json
+import os
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _eastern = ZoneInfo("America/New_York")
+except Exception:
+    # no zoneinfo or tz database, EDGAR's standard time offset
+    _eastern = timezone(timedelta(hours=-5))
+
+
+class WindowExceededError(Exception):
+    """
+    Raised if a result set cannot be narrowed down to the pagination
+    window of the API, so records would be skipped
+    """
+
+
+def _to_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.strptime(value[:10], "%Y-%m-%d")
+
+
+def _to_utc(value, tz=_eastern):
+    """
+    Converts a date or datetime into an aware UTC datetime. Dates and naive
+    datetimes are interpreted in tz (default: US Eastern time, the time
+    zone of EDGAR timestamps such as filedAt).
+    """
+    value = _to_datetime(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz)
+    return value.astimezone(timezone.utc)
+
+
+def _format_datetime(value):
+    # quoted, the time zone offset keeps the bound exact for zoned values
+    return '"' + value.isoformat(timespec="seconds") + '"'
+
+
+def _total(response):
+    total = response.get("total", 0)
+    if isinstance(total, dict):
+        # {"value": 10000, "relation": "gte"}
+        value = total.get("value", 0)
+        return value + 1 if total.get("relation") == "gte" else value
+    return int(total)
+
+
+def _ordered_map(executor, fn, items, max_pending):
+    """
+    Like executor.map(), but only keeps max_pending results in flight
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class JsonlWriter:
+    """
+    Appends records as JSON lines to path
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+
+    def exists(self):
+        return self.file.tell() > 0
+
+    def start_shard(self, shard):
+        pass
+
+    def write(self, records, shard):
+        for record in records:
+            self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def end_shard(self, shard):
+        pass
+
+    def position(self):
+        return self.file.tell()
+
+    def truncate(self, position):
+        self.file.truncate(position)
+        self.file.seek(position)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """
+    Writes the records of every shard into Parquet files in the directory
+    path, one row group per page. A page whose columns don't fit the schema
+    of the current file starts a new file. Requires pyarrow.
+    """
+
+    def __init__(self, path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with: pip install pyarrow"
+            )
+        self.path = path
+        self.file = None
+        self.parts = 0
+        os.makedirs(path, exist_ok=True)
+
+    def _prefix(self, shard):
+        return "part-" + shard.replace(":", "").replace("/", "_").replace('"', "")
+
+    def exists(self):
+        return any(name.endswith(".parquet") for name in os.listdir(self.path))
+
+    def start_shard(self, shard):
+        # remove the files of an earlier, interrupted export of the shard
+        prefix = self._prefix(shard) + "-"
+        for name in os.listdir(self.path):
+            if name.startswith(prefix):
+                os.remove(os.path.join(self.path, name))
+        self.parts = 0
+
+    def write(self, records, shard):
+        import pyarrow
+        import pyarrow.parquet
+
+        if not records:
+            return
+        table = pyarrow.Table.from_pylist(records)
+        if self.file is not None and not table.schema.equals(self.file.schema):
+            schema = self.file.schema
+            try:
+                fits = pyarrow.unify_schemas([schema, table.schema]).equals(schema)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                fits = False
+            if fits:
+                # missing columns are filled with nulls
+                table = pyarrow.Table.from_pylist(records, schema=schema)
+            else:
+                self.file.close()
+                self.file = None
+        if self.file is None:
+            name = self._prefix(shard) + "-%05d.parquet" % self.parts
+            self.parts += 1
+            self.file = pyarrow.parquet.ParquetWriter(
+                os.path.join(self.path, name), table.schema
+            )
+        self.file.write_table(table)
+
+    def end_shard(self, shard):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def position(self):
+        return None
+
+    def truncate(self, position):
+        # shards are written to separate files, only a reset is supported
+        if position == 0:
+            for name in os.listdir(self.path):
+                if name.startswith("part-") and name.endswith(".parquet"):
+                    os.remove(os.path.join(self.path, name))
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class BulkExporter:
+    """
+    Pulls the entire result set of a query from any API exposing
+    get_data(query) (or get_filings(query)) with "from"/"size" pagination.
+
+    The date range [start, end] is split into shards with a range filter on
+    date_field. Shards with more results than the pagination window of the
+    API (max_window) are halved until they fit; a one-second shard that
+    still doesn't fit raises WindowExceededError. Pages of a shard are
+    fetched in parallel by max_workers threads.
+
+    api: API instance, e.g. InsiderTradingApi, or a function query -> response
+    date_field: field used for sharding, e.g. "filedAt", or None to disable
+        sharding (only the first max_window results are retrieved, with a
+        warning)
+    records_key: key of the result list in the response, e.g. "transactions".
+        Detected automatically if not set.
+    checkpoint_path: JSON file tracking exported shards. An interrupted
+        export() resumes from the last completed shard.
+    """
+
+    def __init__(
+        self,
+        api,
+        date_field="filedAt",
+        page_size=50,
+        max_workers=4,
+        max_window=10000,
+        shard_days=30,
+        records_key=None,
+        checkpoint_path=None,
+    ):
+        if callable(api):
+            self.fetch = api
+        elif hasattr(api, "get_data"):
+            self.fetch = api.get_data
+        else:
+            self.fetch = api.get_filings
+
+        self.date_field = date_field
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.max_window = max_window
+        self.shard_days = shard_days
+        self.records_key = records_key
+        self.checkpoint_path = checkpoint_path
+
+    def _records(self, response):
+        if self.records_key is None:
+            for key, value in response.items():
+                if isinstance(value, list):
+                    self.records_key = key
+                    break
+            else:
+                return []
+        return response.get(self.records_key, [])
+
+    def _page_query(self, query, shard, offset):
+        page_query = dict(query)
+        page_query["from"] = str(offset)
+        page_query["size"] = str(self.page_size)
+
+        if shard is not None:
+            lower, upper = shard
+            page_query["query"] = (
+                "("
+                + query.get("query", "*:*")
+                + ") AND "
+                + self.date_field
+                + ":["
+                + _format_datetime(lower)
+                + " TO "
+                + _format_datetime(upper)
+                + "}"
+            )
+            page_query["sort"] = [{self.date_field: {"order": "asc"}}]
+
+        return page_query
+
+    def _shards(self, start, end):
+        # shards are computed in UTC, so DST changes don't shift the bounds
+        lower = _to_utc(start)
+        # end date is inclusive
+        end = _to_utc(_to_datetime(end) + timedelta(days=1))
+        while lower < end:
+            upper = min(lower + timedelta(days=self.shard_days), end)
+            yield (lower, upper)
+            lower = upper
+
+    def _iter_shard(self, executor, query, shard):
+        """
+        Yields the pages of records of one shard, splitting the shard
+        if it holds more results than the pagination window.
+        """
+        first = self.fetch(self._page_query(query, shard, 0))
+        total = _total(first)
+
+        if total > self.max_window:
+            if shard is None:
+                warnings.warn(
+                    "Query matches %d records, only the first %d are retrieved "
+                    "without a date_field" % (total, self.max_window)
+                )
+            else:
+                lower, upper = shard
+                middle = lower + (upper - lower) / 2
+                if middle - lower < timedelta(seconds=1):
+                    raise WindowExceededError(
+                        "%d records with %s in [%s, %s) exceed the pagination "
+                        "window of %d records"
+                        % (total, self.date_field, lower, upper, self.max_window)
+                    )
+                middle = middle.replace(microsecond=0)
+                for half in ((lower, middle), (middle, upper)):
+                    for page in self._iter_shard(executor, query, half):
+                        yield page
+                return
+
+        yield self._records(first)
+
+        offsets = range(self.page_size, min(total, self.max_window), self.page_size)
+
+        def fetch_page(offset):
+            return self._records(self.fetch(self._page_query(query, shard, offset)))
+
+        for page in _ordered_map(
+            executor, fetch_page, offsets, max_pending=self.max_workers * 2
+        ):
+            if not page:
+                break
+            yield page
+
+    def _iter_shard_pages(self, query, start, end):
+        if self.date_field is None or start is None or end is None:
+            shards = [None]
+        else:
+            shards = self._shards(start, end)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for shard in shards:
+                yield shard, self._iter_shard(executor, query, shard)
+
+    def iter_records(self, query, start=None, end=None):
+        """
+        Yields all records matching query with date_field between start
+        and end (inclusive, format: YYYY-MM-DD), one at a time.
+        """
+        for shard, pages in self._iter_shard_pages(query, start, end):
+            for page in pages:
+                for record in page:
+                    yield record
+
+    def _checkpoint_key(self, query, path, start, end, format):
+        return {
+            "query": query,
+            "path": os.path.abspath(path),
+            "start": _to_datetime(start).date().isoformat() if start else None,
+            "end": _to_datetime(end).date().isoformat() if end else None,
+            "format": format,
+        }
+
+    def _load_checkpoint(self, key):
+        """
+        Returns the checkpoint of an earlier export with the same query,
+        path, range and format, or None if there is no checkpoint
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        # round trip through JSON to compare like with like
+        if checkpoint.get("export") != json.loads(json.dumps(key)):
+            raise ValueError(
+                "Checkpoint "
+                + self.checkpoint_path
+                + " belongs to a different export: "
+                + json.dumps(checkpoint.get("export"))
+            )
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint):
+        if not self.checkpoint_path:
+            return
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def export(
+        self, query, path, start=None, end=None, format="jsonl", overwrite=False
+    ):
+        """
+        Writes all records matching query to path, shard by shard and page
+        by page.
+
+        format: "jsonl" writes a JSON lines file, "parquet" writes Parquet
+            files with one row group per page into the directory path.
+        overwrite: replace existing output. Without a matching checkpoint,
+            existing output raises FileExistsError unless overwrite is set.
+
+        The checkpoint stores query, path, start, end and format. Resuming
+        with a checkpoint of a different export raises ValueError.
+
+        Returns the total number of exported records.
+        """
+        if format == "jsonl":
+            writer = JsonlWriter(path)
+        elif format == "parquet":
+            writer = ParquetWriter(path)
+        else:
+            raise ValueError("format must be jsonl or parquet")
+
+        key = self._checkpoint_key(query, path, start, end, format)
+        try:
+            checkpoint = self._load_checkpoint(key)
+            if checkpoint is not None:
+                # drop records of a shard that was interrupted mid-way
+                if checkpoint["position"] is not None:
+                    writer.truncate(checkpoint["position"])
+            elif writer.exists() and not overwrite:
+                raise FileExistsError(
+                    path + " exists, pass overwrite=True to replace it"
+                )
+            else:
+                writer.truncate(0)
+                checkpoint = {
+                    "export": key,
+                    "completed": [],
+                    "records": 0,
+                    "position": writer.position(),
+                }
+                self._save_checkpoint(checkpoint)
+            completed = set(checkpoint["completed"])
+
+            for shard, pages in self._iter_shard_pages(query, start, end):
+                if shard is None:
+                    shard_id = "all"
+                else:
+                    shard_id = (
+                        shard[0].isoformat(timespec="seconds")
+                        + "/"
+                        + shard[1].isoformat(timespec="seconds")
+                    )
+                if shard_id in completed:
+                    continue
+
+                writer.start_shard(shard_id)
+                count = 0
+                for page in pages:
+                    writer.write(page, shard_id)
+                    count += len(page)
+                writer.end_shard(shard_id)
+
+                checkpoint["completed"].append(shard_id)
+                checkpoint["records"] += count
+                checkpoint["position"] = writer.position()
+                self._save_checkpoint(checkpoint)
+        finally:
+            writer.close()
+
+        return checkpoint["records"]
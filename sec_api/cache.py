@@ -0,0 +1,244 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class DiskCache:
+    """
+    Persistent, content-addressed on-disk cache for immutable API responses,
+    e.g. filings, XBRL-to-JSON conversions and extracted sections.
+
+    Entries are stored compressed in directory, named by the SHA-256 hash
+    of their key. Once the cache grows beyond max_size bytes, the least
+    recently used entries are evicted. Entries are written atomically, so
+    multiple processes can share one cache directory.
+
+        from sec_api import RenderApi, DiskCache
+
+        cache = DiskCache("~/.cache/sec-api", max_size=10 * 1024**3)
+        renderApi = RenderApi("YOUR_API_KEY", cache=cache)
+    """
+
+    def __init__(self, directory, max_size=1024**3, compress=True):
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self.compress = compress
+        self._size = None
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key):
+        """
+        Returns the cached bytes of key or None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # the modification time tracks the last access for LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        if data[:1] == b"z":
+            return zlib.decompress(data[1:])
+        return data[1:]
+
+    def set(self, key, value):
+        """
+        Stores the bytes value under key
+        """
+        if self.compress:
+            data = b"z" + zlib.compress(value, 6)
+        else:
+            data = b"r" + value
+
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            evict = self._size > self.max_size
+
+        if evict:
+            self.evict()
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached bytes of key, or calls loader(),
+        caches and returns its result
+        """
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".tmp") or name == ".lock":
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache
+        is at 90% of max_size
+        """
+        lock_file = open(os.path.join(self.directory, ".lock"), "w")
+        try:
+            # only one process evicts at a time
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            size = sum(entry[1] for entry in entries)
+            target = self.max_size * 0.9
+
+            for path, entry_size, _ in entries:
+                if size <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                size -= entry_size
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+        with self._lock:
+            self._size = size
+
+    def clear(self):
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._size = 0
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with a bounded number of entries (LRU)
+    and a time-to-live per entry, e.g. for MappingApi.resolve and
+    FloatApi.get_float lookups.
+
+    Concurrent get_or_load calls for the same key are coalesced: only the
+    first caller runs the loader, all others wait for and share its result.
+    Cached values are shared between callers and must not be modified.
+
+        from sec_api import MappingApi, TTLCache
+
+        cache = TTLCache(maxsize=100000, ttl=86400)
+        mappingApi = MappingApi("YOUR_API_KEY", cache=cache)
+    """
+
+    def __init__(self, maxsize=10000, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        # must be called with self._lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key):
+        """
+        Returns the cached value of key or None
+        """
+        with self._lock:
+            entry = self._get(key)
+        return entry[1] if entry else None
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached value of key, or calls loader(), caches and
+        returns its result. Exceptions raised by loader are not cached.
+        """
+        with self._lock:
+            entry = self._get(key)
+            if entry:
+                return entry[1]
+            future = self._pending.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self._pending[key] = future
+
+        if not is_loader:
+            return future.result()
+
+        try:
+            value = loader()
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,109 @@
+"""
+Shared base of the numpy column stores (HoldingsStore and
+InsiderTransactionStore).
+
+Requires numpy: pip install sec-api[numpy]
+"""
+
+from datetime import date
+
+_epoch = date(1970, 1, 1).toordinal()
+# integer representation of NaT
+_not_a_time = -(2**63)
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "HoldingsStore and InsiderTransactionStore require numpy. "
+            "Install it with: pip install numpy"
+        )
+    return numpy
+
+
+def _day_number(value):
+    # days since 1970-01-01, the integer representation of datetime64[D]
+    if not value:
+        return _not_a_time
+    return date.fromisoformat(str(value)[:10]).toordinal() - _epoch
+
+
+class ColumnarStore:
+    """
+    Records of many filings stored as typed array.array columns in
+    self._data and converted to numpy arrays on demand. Filings are
+    deduplicated by accession number.
+
+    Subclasses set records_key (the list of filings in a get_data()
+    response) and date_columns (columns of day numbers returned as
+    datetime64[D]), fill self._data in __init__ and implement
+    _convert(filings) and _append(record).
+    """
+
+    records_key = None
+    date_columns = ()
+
+    def __init__(self):
+        self.accession_numbers = set()
+        self._data = {}
+        self._arrays = None
+
+    def _convert(self, filings):
+        raise NotImplementedError
+
+    def _append(self, record):
+        raise NotImplementedError
+
+    def add(self, items):
+        """
+        Adds the records of a get_data() response or an iterable of
+        filings or records. Returns the number of added records. Filings
+        added by an earlier call or passed more than once are skipped.
+        Records passed directly belong to the filing of their accession
+        number, wherever they appear in items.
+        """
+        if isinstance(items, dict):
+            items = items.get(self.records_key, [])
+        # accession numbers added by this call, and those passed as filings
+        added = set()
+        filings = set()
+        count = 0
+        for item in items:
+            if isinstance(item, dict):
+                accession_no = item.get("accessionNo")
+                if accession_no in self.accession_numbers or accession_no in added:
+                    continue
+                filings.add(accession_no)
+                records = self._convert([item])
+            else:
+                accession_no = item.accessionNo
+                if accession_no in self.accession_numbers or accession_no in filings:
+                    continue
+                records = (item,)
+            added.add(accession_no)
+            for record in records:
+                self._append(record)
+                count += 1
+
+        self.accession_numbers.update(added)
+        self._arrays = None
+        return count
+
+    def __len__(self):
+        return len(next(iter(self._data.values())))
+
+    def arrays(self):
+        """
+        Returns the columns as numpy arrays (cached until the next add)
+        """
+        if self._arrays is None:
+            numpy = _import_numpy()
+            self._arrays = {
+                name: numpy.array(column, dtype=column.typecode)
+                for name, column in self._data.items()
+            }
+            for name in self.date_columns:
+                self._arrays[name] = self._arrays[name].astype("datetime64[D]")
+        return self._arrays
@@ -0,0 +1,73 @@
+import json
+
+
+def _load_orjson():
+    import orjson
+
+    return orjson.loads
+
+
+def _load_msgspec():
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def _load_json():
+    return json.loads
+
+
+json_decoders = {
+    "orjson": _load_orjson,
+    "msgspec": _load_msgspec,
+    "json": _load_json,
+}
+
+_decoder = None
+
+
+def set_json_decoder(decoder="auto"):
+    """
+    Sets the JSON decoder used for all API responses:
+
+    "auto": orjson or msgspec if installed, else the standard library
+    "orjson", "msgspec" or "json": the given library
+    a callable that takes bytes and returns the decoded object
+
+    Fast decoders parse response bytes directly, without decoding the
+    body to a str first, which matters for multi-megabyte responses such
+    as 13F holdings, N-PORT and N-PX voting records.
+    """
+    global _decoder
+
+    if callable(decoder):
+        _decoder = decoder
+        return
+
+    if decoder == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                _decoder = json_decoders[name]()
+                return
+            except ImportError:
+                continue
+        _decoder = json.loads
+        return
+
+    if decoder not in json_decoders:
+        raise ValueError("JSON decoder not supported: " + str(decoder))
+    try:
+        _decoder = json_decoders[decoder]()
+    except ImportError:
+        raise ImportError(
+            decoder + " is not installed. Install it with: pip install " + decoder
+        )
+
+
+def loads(data):
+    """
+    Decodes JSON bytes or str with the configured decoder
+    """
+    if _decoder is None:
+        set_json_decoder()
+    return _decoder(data)
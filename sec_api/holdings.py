@@ -0,0 +1,260 @@
+"""
+Columnar store and vectorized analytics for Form 13F holdings.
+
+Requires numpy: pip install sec-api[numpy]
+
+    from sec_api import Form13FHoldingsApi, HoldingsStore
+
+    form13FHoldingsApi = Form13FHoldingsApi("YOUR_API_KEY")
+    store = HoldingsStore.from_api(
+        form13FHoldingsApi,
+        {"query": "periodOfReport:[2023-12-31 TO 2024-03-31]"},
+        start="2024-01-01",
+        end="2024-06-30",
+    )
+
+    changes = store.changes("2024-03-31", "2023-12-31")
+    holders = store.top_holders("037833100", "2024-03-31", n=10)
+"""
+
+from array import array
+
+from sec_api.bulk import BulkExporter
+from sec_api.columnar import ColumnarStore, _day_number, _import_numpy
+from sec_api.models import holdings_13f
+
+
+class HoldingsStore(ColumnarStore):
+    """
+    Holdings of many 13F filers and periods stored as typed columns:
+    manager CIK (int64), period of report (datetime64[D]), CUSIP (integer
+    codes into a dictionary of CUSIPs), value and shares (float64) and a
+    put/call flag. Analytics run vectorized on numpy arrays and aggregate
+    positions per manager and CUSIP, so multiple lines of the same
+    security in one filing are summed up.
+
+    Option positions (putCall set) are excluded from all analytics unless
+    include_options is True. Filings are deduplicated by accession number.
+    """
+
+    records_key = "data"
+    date_columns = ("period",)
+
+    def __init__(self, include_options=False):
+        super().__init__()
+        self.include_options = include_options
+        self._cusip_codes = {}
+        self._cusips = []
+        self._issuers = []
+        self._data = {
+            "cik": array("q"),
+            "period": array("q"),
+            "cusip": array("q"),
+            "value": array("d"),
+            "shares": array("d"),
+            "option": array("b"),
+        }
+
+    @classmethod
+    def from_api(cls, api, query, start=None, end=None, max_workers=4, **kwargs):
+        """
+        Loads the holdings of all filings matching query, filed between
+        start and end, from a Form13FHoldingsApi
+        """
+        store = cls(**kwargs)
+        exporter = BulkExporter(api, max_workers=max_workers, records_key="data")
+        store.add(exporter.iter_records(query, start, end))
+        return store
+
+    def _convert(self, filings):
+        return holdings_13f(filings)
+
+    def _cusip_code(self, record):
+        cusip = record.cusip or ""
+        code = self._cusip_codes.get(cusip)
+        if code is None:
+            code = len(self._cusips)
+            self._cusip_codes[cusip] = code
+            self._cusips.append(cusip)
+            self._issuers.append(record.nameOfIssuer)
+        return code
+
+    def _append(self, record):
+        data = self._data
+        data["cik"].append(int(record.cik or 0))
+        data["period"].append(_day_number(record.periodOfReport))
+        data["cusip"].append(self._cusip_code(record))
+        data["value"].append(float(record.value or 0))
+        data["shares"].append(float(record.shares or 0))
+        data["option"].append(1 if record.putCall else 0)
+
+    @property
+    def periods(self):
+        """
+        Sorted periods of report (YYYY-MM-DD) in the store
+        """
+        numpy = _import_numpy()
+        periods = numpy.unique(self.arrays()["period"])
+        return [str(period) for period in periods[~numpy.isnat(periods)]]
+
+    def _positions(self, period):
+        """
+        Returns the sorted composite keys (cik * number of CUSIPs + CUSIP
+        code) of all positions in period with their summed shares and value
+        """
+        numpy = _import_numpy()
+        columns = self.arrays()
+        mask = columns["period"] == numpy.datetime64(str(period)[:10], "D")
+        if not self.include_options:
+            mask &= columns["option"] == 0
+
+        keys = columns["cik"][mask] * len(self._cusips) + columns["cusip"][mask]
+        keys, inverse = numpy.unique(keys, return_inverse=True)
+        shares = numpy.bincount(inverse, columns["shares"][mask], len(keys))
+        value = numpy.bincount(inverse, columns["value"][mask], len(keys))
+        return keys, shares, value
+
+    def _split(self, keys):
+        # inverse of the composite key, returns (ciks, CUSIP codes)
+        return _import_numpy().divmod(keys, max(len(self._cusips), 1))
+
+    def _cusip_values(self, codes):
+        numpy = _import_numpy()
+        return numpy.array(self._cusips, dtype=object)[codes]
+
+    def positions(self, period):
+        """
+        Returns a dict of arrays cik, cusip, shares and value with one
+        entry per manager and CUSIP held in period
+        """
+        keys, shares, value = self._positions(period)
+        ciks, codes = self._split(keys)
+        return {
+            "cik": ciks,
+            "cusip": self._cusip_values(codes),
+            "shares": shares,
+            "value": value,
+        }
+
+    def changes(self, period, previous_period):
+        """
+        Returns the position changes of every manager from previous_period
+        to period as a dict of arrays cik, cusip, shares_prev, shares,
+        shares_change, value_prev, value, value_change and status
+        ("new", "closed", "increased", "decreased" or "unchanged")
+        """
+        numpy = _import_numpy()
+        keys, shares, value = self._positions(period)
+        prev_keys, prev_shares, prev_value = self._positions(previous_period)
+
+        all_keys = numpy.union1d(keys, prev_keys)
+        current = numpy.zeros((2, len(all_keys)))
+        previous = numpy.zeros((2, len(all_keys)))
+        current[:, numpy.searchsorted(all_keys, keys)] = shares, value
+        previous[:, numpy.searchsorted(all_keys, prev_keys)] = prev_shares, prev_value
+
+        delta = current[0] - previous[0]
+        status = numpy.full(len(all_keys), "unchanged", dtype=object)
+        status[delta > 0] = "increased"
+        status[delta < 0] = "decreased"
+        status[~numpy.isin(all_keys, prev_keys, assume_unique=True)] = "new"
+        status[~numpy.isin(all_keys, keys, assume_unique=True)] = "closed"
+
+        ciks, codes = self._split(all_keys)
+        return {
+            "cik": ciks,
+            "cusip": self._cusip_values(codes),
+            "shares_prev": previous[0],
+            "shares": current[0],
+            "shares_change": delta,
+            "value_prev": previous[1],
+            "value": current[1],
+            "value_change": current[1] - previous[1],
+            "status": status,
+        }
+
+    def by_cusip(self, period):
+        """
+        Aggregates all positions in period per CUSIP. Returns a dict of
+        arrays cusip, issuer, holders, shares and value, sorted by value
+        (descending)
+        """
+        numpy = _import_numpy()
+        keys, shares, value = self._positions(period)
+        _, codes = self._split(keys)
+        size = len(self._cusips)
+        holders = numpy.bincount(codes, minlength=size)
+        total_shares = numpy.bincount(codes, shares, size)
+        total_value = numpy.bincount(codes, value, size)
+
+        held = numpy.flatnonzero(holders)
+        order = held[numpy.argsort(-total_value[held], kind="stable")]
+        return {
+            "cusip": self._cusip_values(order),
+            "issuer": numpy.array(self._issuers, dtype=object)[order],
+            "holders": holders[order],
+            "shares": total_shares[order],
+            "value": total_value[order],
+        }
+
+    def top_holders(self, cusip, period, n=10):
+        """
+        Returns the n largest holders of cusip in period as a dict of
+        arrays cik, shares and value, sorted by value (descending)
+        """
+        numpy = _import_numpy()
+        keys, shares, value = self._positions(period)
+        ciks, codes = self._split(keys)
+        mask = codes == self._cusip_codes.get(cusip, -1)
+        order = numpy.argsort(-value[mask], kind="stable")[:n]
+        return {
+            "cik": ciks[mask][order],
+            "shares": shares[mask][order],
+            "value": value[mask][order],
+        }
+
+    def overlap(self, ciks, period):
+        """
+        Returns the number of CUSIPs held in common by every pair of the
+        given managers in period as a len(ciks) x len(ciks) matrix. The
+        diagonal holds the number of CUSIPs held by each manager.
+        """
+        numpy = _import_numpy()
+        keys, _, _ = self._positions(period)
+        position_ciks, codes = self._split(keys)
+        ciks = numpy.array([int(cik) for cik in ciks], dtype=numpy.int64)
+
+        # row of every position in the manager x CUSIP matrix
+        sorter = numpy.argsort(ciks)
+        rows = numpy.searchsorted(ciks, position_ciks, sorter=sorter)
+        rows = sorter[numpy.minimum(rows, len(ciks) - 1)] if len(ciks) else rows
+        matched = ciks[rows] == position_ciks if len(ciks) else rows < 0
+
+        held = numpy.zeros((len(ciks), len(self._cusips)), dtype=numpy.float32)
+        held[rows[matched], codes[matched]] = 1
+        return (held @ held.T).astype(numpy.int64)
+
+    def to_pandas(self):
+        """
+        Returns all holdings as a pandas DataFrame
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError(
+                "DataFrame conversion requires pandas. Install it with: pip install pandas"
+            )
+        numpy = _import_numpy()
+        columns = self.arrays()
+        return pandas.DataFrame(
+            {
+                "cik": columns["cik"],
+                "period": columns["period"].astype("datetime64[ns]"),
+                "cusip": pandas.Categorical.from_codes(
+                    columns["cusip"], numpy.array(self._cusips, dtype=object)
+                ),
+                "value": columns["value"],
+                "shares": columns["shares"],
+                "option": columns["option"].astype(bool),
+            }
+        )
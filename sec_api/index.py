@@ -1,7 +1,23 @@
-import requests
-import json
+import heapq
+import os
+import queue
 import re
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from sec_api.bulk import WindowExceededError
+from sec_api.decoding import loads
+from sec_api.models import (
+    NpxVote,
+    holdings_13f,
+    insider_transactions,
+    npx_votes,
+    nport_holdings,
+)
+from sec_api.transport import get_default_transport, parse_retry_after
+from sec_api.utils import iter_completed, iter_json_array
+from sec_api.xbrl import XbrlPanel
 
 query_api_endpoint = "https://api.sec-api.io"
 full_text_search_api_endpoint = "https://api.sec-api.io/full-text-search"
@@ -56,33 +72,174 @@ def handle_api_error(response):
     raise Exception("API error: {} - {}".format(response.status_code, response.text))
 
 
+def get_stream(transport, url, proxies, headers=None, retry_statuses=()):
+    """
+    Sends a streaming GET request and returns the response with
+    status 200 or 304 without reading its body.
+    """
+    response = transport.get(
+        url,
+        headers=headers,
+        proxies=proxies,
+        stream=True,
+        retry_statuses=retry_statuses,
+    )
+    if response.status_code == 200 or response.status_code == 304:
+        return response
+    # release the connection back to the pool
+    with response:
+        handle_api_error(response)
+
+
+def post_stream_array(transport, url, query, proxies, key, chunk_size=65536):
+    """
+    Sends a streaming POST request and yields the items of the array
+    stored under key in the response, decoded one at a time while the
+    response is downloaded
+    """
+    response = transport.post(url, json=query, proxies=proxies, stream=True)
+    with response:
+        if response.status_code != 200:
+            handle_api_error(response)
+        for item in iter_json_array(response.iter_content(chunk_size=chunk_size), key):
+            yield item
+
+
+def write_stream(response, file, chunk_size=65536):
+    """
+    Writes the body of a streaming response to file, a path or a
+    writable binary file-like object, and returns the number of bytes
+    written. Paths are written to a temporary ".part" file first, so
+    an interrupted download never leaves a truncated file behind.
+    """
+    size = 0
+
+    if not isinstance(file, str):
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            file.write(chunk)
+            size += len(chunk)
+        return size
+
+    directory = os.path.dirname(file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = file + ".part"
+    with open(tmp_path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+            size += len(chunk)
+    os.replace(tmp_path, file)
+
+    return size
+
+
+def archive_path(url, dest_dir):
+    """
+    Returns the path of an EDGAR file under dest_dir using the same
+    directory structure as EDGAR, e.g.
+    dest_dir/1045810/000104581023000014/nvda-20230222.htm
+    """
+    filename = re.sub(r"ix\?doc=/", "", url)
+    filename = re.sub(r"https://www.sec.gov/Archives/edgar/data/", "", filename)
+    filename = re.sub(r"^https?://[^/]+/", "", filename)
+    parts = [p for p in filename.split("/") if p not in ("", ".", "..")]
+    return os.path.join(dest_dir, *parts)
+
+
 class QueryApi:
     """
     Base class for Query API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = query_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_filings(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
+
+    def iter_filings(self, query, max_window=10000):
+        """
+        Yields all filings matching query["query"], one at a time, newest first.
+
+        Pages are fetched in the background while the previous page is
+        consumed. Once the next page would exceed the result window of the
+        API (max_window), the query is narrowed to filings filed at or before
+        the last yielded filing and pagination restarts at "from" = 0.
+        Raises WindowExceededError if more than max_window filings share
+        one filedAt timestamp, instead of skipping filings.
+        """
+        base_query = query.get("query", "*:*")
+        size = int(query.get("size", 50))
+        upper = None
+        # accession numbers of all yielded filings filed at last_filed_at
+        last_filed_at = None
+        boundary_ids = set()
+        skip_ids = set()
+
+        def fetch(offset, upper):
+            page_query = dict(query)
+            page_query["from"] = str(offset)
+            page_query["size"] = str(size)
+            page_query["sort"] = [{"filedAt": {"order": "desc"}}]
+            if upper is not None:
+                bounds = '[* TO "' + upper + '"]'
+                page_query["query"] = "(" + base_query + ") AND filedAt:" + bounds
+            return self.get_filings(page_query)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            future = executor.submit(fetch, offset, upper)
+
+            while future is not None:
+                filings = future.result().get("filings", [])
+                page_skip_ids = skip_ids
+
+                for filing in filings:
+                    if filing.get("filedAt") != last_filed_at:
+                        last_filed_at = filing.get("filedAt")
+                        boundary_ids = set()
+                    boundary_ids.add(filing.get("accessionNo"))
+
+                # prefetch the next page before handing out the current one
+                future = None
+                error = None
+                if len(filings) == size:
+                    offset += size
+                    if offset + size <= max_window:
+                        future = executor.submit(fetch, offset, upper)
+                    elif upper == last_filed_at:
+                        # a full window of filings at one timestamp
+                        error = WindowExceededError(
+                            "More than %d filings share filedAt %s, the "
+                            "rest cannot be retrieved by slicing on filedAt"
+                            % (max_window, last_filed_at)
+                        )
+                    else:
+                        # slice on filedAt to get past the result window
+                        upper = last_filed_at
+                        skip_ids = set(boundary_ids)
+                        offset = 0
+                        future = executor.submit(fetch, offset, upper)
+
+                for filing in filings:
+                    if filing.get("accessionNo") in page_skip_ids:
+                        continue
+                    yield filing
+
+                if error is not None:
+                    raise error
+        finally:
+            executor.shutdown(wait=False)
 
 
 class FullTextSearchApi:
@@ -90,28 +247,19 @@ class FullTextSearchApi:
     Base class for Full-Text Search API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = full_text_search_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_filings(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class RenderApi:
@@ -119,50 +267,133 @@ class RenderApi:
     Base class for Render API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None, cache=None):
         self.api_key = api_key
         self.api_endpoint = filing_download_api_endpoint
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
+        self.cache = cache
 
     def get_filing(self, url, return_binary=False):
-        response = {}
-        # remove "ix?doc=/" from URL
-        filename = re.sub(r"ix\?doc=/", "", url)
-        filename = re.sub(r"https://www.sec.gov/Archives/edgar/data", "", filename)
-        _url = self.api_endpoint + filename + "?token=" + self.api_key
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(_url, proxies=self.proxies)
-            if response.status_code == 200:
-                return response.text if not return_binary else response.content
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        return self.get_file(url, return_binary)
 
     def get_file(self, url, return_binary=False):
-        response = {}
+        if self.cache is not None:
+            key = "render:" + self._file_path(url)
+            key += ":binary" if return_binary else ":text"
+            value = self.cache.get(key)
+            if value is not None:
+                return value if return_binary else value.decode("utf-8")
+
+        response = self.transport.get(self._file_url(url), proxies=self.proxies)
+        if response.status_code != 200:
+            handle_api_error(response)
+
+        value = response.text if not return_binary else response.content
+        if self.cache is not None:
+            self.cache.set(key, value if return_binary else value.encode("utf-8"))
+        return value
+
+    def _file_path(self, url):
         # remove "ix?doc=/" from URL
         filename = re.sub(r"ix\?doc=/", "", url)
         filename = re.sub(r"https://www.sec.gov/Archives/edgar/data", "", filename)
-        _url = self.api_endpoint + filename + "?token=" + self.api_key
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(_url, proxies=self.proxies)
-            if response.status_code == 200:
-                return response.text if not return_binary else response.content
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        return filename
+
+    def _file_url(self, url):
+        return self.api_endpoint + self._file_path(url) + "?token=" + self.api_key
+
+    def iter_file(self, url, chunk_size=65536):
+        """
+        Yields the content of a filing, exhibit or any other file in
+        chunks of up to chunk_size bytes without loading the entire
+        file into memory.
+        """
+        response = get_stream(self.transport, self._file_url(url), self.proxies)
+        with response:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                yield chunk
+
+    def save_file(self, url, file, chunk_size=65536):
+        """
+        Streams a filing, exhibit or any other file to file, a path or
+        a writable binary file-like object. Returns the number of bytes written.
+        """
+        response = get_stream(self.transport, self._file_url(url), self.proxies)
+        with response:
+            return write_stream(response, file, chunk_size)
+
+    def _download(self, url, path, chunk_size=65536):
+        """
+        Streams the file at url to path and returns "downloaded", or
+        "skipped" if path already holds the same file (same ETag or size).
+        """
+        etag_path = path + ".etag"
+        headers = {}
+        if os.path.exists(path) and os.path.exists(etag_path):
+            with open(etag_path, "r") as f:
+                headers["If-None-Match"] = f.read().strip()
+
+        response = get_stream(
+            self.transport, self._file_url(url), self.proxies, headers=headers
+        )
+
+        with response:
+            if response.status_code == 304:
+                return "skipped"
+
+            content_length = response.headers.get("Content-Length")
+            if (
+                os.path.exists(path)
+                and content_length is not None
+                and os.path.getsize(path) == int(content_length)
+            ):
+                return "skipped"
+
+            write_stream(response, path, chunk_size)
+
+            etag = response.headers.get("ETag")
+            if etag:
+                with open(etag_path, "w") as f:
+                    f.write(etag)
+
+        return "downloaded"
+
+    def download_many(self, urls, dest_dir, max_workers=10):
+        """
+        Downloads many filings, exhibits or other files concurrently and
+        streams each file to disk. Files are stored under dest_dir using
+        the same directory structure as EDGAR, e.g.
+        dest_dir/1045810/000104581023000014/nvda-20230222.htm
+
+        Requests are paced by the "archive" rate limit of the transport
+        (default: 40 per second). Files already present in dest_dir with
+        the same ETag or size are skipped. A failed download does not
+        abort the batch. max_workers defaults to the pool_maxsize of the
+        default Transport, raise both together so every worker keeps its
+        connection alive.
+
+        Returns a list of dicts with url, path, status ("downloaded",
+        "skipped" or "failed") and error, in order of completion.
+        """
+
+        def target_path(url):
+            return archive_path(url, dest_dir)
+
+        def download(url):
+            return self._download(url, target_path(url))
+
+        results = []
+        for url, status, error in iter_completed(download, urls, max_workers):
+            results.append(
+                {
+                    "url": url,
+                    "path": target_path(url),
+                    "status": status if error is None else "failed",
+                    "error": str(error) if error is not None else None,
+                }
+            )
+        return results
 
 
 class PdfGeneratorApi:
@@ -170,30 +401,176 @@ class PdfGeneratorApi:
     Base class for PDF Generator API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = pdf_generator_api_endpoint
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_pdf(self, url):
-        response = {}
         file_url = re.sub(r"ix\?doc=/", "", url)
         _url = (
             self.api_endpoint + "?type=pdf&url=" + file_url + "&token=" + self.api_key
         )
 
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(_url, proxies=self.proxies)
-            if response.status_code == 200:
-                return response.content
-            elif response.status_code == 429 or response.status_code == 202:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
+        response = self.transport.get(_url, proxies=self.proxies, retry_statuses=(202,))
+        if response.status_code == 200:
+            return response.content
+        handle_api_error(response)
+
+    def _pdf_url(self, url):
+        file_url = re.sub(r"ix\?doc=/", "", url)
+        return (
+            self.api_endpoint + "?type=pdf&url=" + file_url + "&token=" + self.api_key
+        )
+
+    def iter_pdf(self, url, chunk_size=65536):
+        """
+        Yields the PDF of a filing or exhibit in chunks of up to chunk_size
+        bytes without loading the entire PDF into memory.
+        """
+        response = get_stream(
+            self.transport, self._pdf_url(url), self.proxies, retry_statuses=(202,)
+        )
+        with response:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                yield chunk
+
+    def save_pdf(self, url, file, chunk_size=65536):
+        """
+        Streams the PDF of a filing or exhibit to file, a path or a writable
+        binary file-like object. Returns the number of bytes written.
+        """
+        response = get_stream(
+            self.transport, self._pdf_url(url), self.proxies, retry_statuses=(202,)
+        )
+        with response:
+            return write_stream(response, file, chunk_size)
+
+    def _poll_pdf(self, url, path, chunk_size):
+        """
+        Requests the PDF once. Returns None once the PDF is saved to path,
+        or the response headers if the PDF is still being generated (202).
+        """
+        response = self.transport.get(
+            self._pdf_url(url), proxies=self.proxies, stream=True
+        )
+        with response:
+            if response.status_code == 202:
+                return response.headers
+            if response.status_code != 200:
                 handle_api_error(response)
-        else:
-            handle_api_error(response)
+            write_stream(response, path, chunk_size)
+        return None
+
+    def save_pdfs(
+        self,
+        urls,
+        dest_dir,
+        max_workers=8,
+        max_jobs=100,
+        deadline=600,
+        min_interval=1,
+        max_interval=30,
+        chunk_size=65536,
+    ):
+        """
+        Converts many filings or exhibits to PDF and streams each PDF to
+        dest_dir as soon as it is generated, using the same directory
+        structure as EDGAR, e.g.
+        dest_dir/1045810/000104581023000014/nvda-20230222.pdf
+
+        Up to max_jobs PDFs are generated at the same time. While a PDF is
+        being generated (status 202), it is polled again after an interval
+        that starts at min_interval seconds and grows up to max_interval
+        (or as given by Retry-After). Jobs not finished within deadline
+        seconds fail. Existing PDFs in dest_dir are skipped.
+
+        Yields dicts with url, path, status ("downloaded", "skipped" or
+        "failed") and error, in order of completion.
+        """
+        urls = iter(urls)
+        # (next poll time, sequence number, job)
+        scheduled = []
+        pending = {}
+        sequence = 0
+        jobs = 0
+
+        def result(job, status, error=None):
+            return {
+                "url": job["url"],
+                "path": job["path"],
+                "status": status,
+                "error": str(error) if error is not None else None,
+            }
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # start new jobs
+                while jobs < max_jobs:
+                    url = next(urls, None)
+                    if url is None:
+                        break
+                    path = re.sub(r"\.[^./\\]*$", "", archive_path(url, dest_dir))
+                    job = {
+                        "url": url,
+                        "path": path + ".pdf",
+                        "started_at": time.monotonic(),
+                        "interval": min_interval,
+                    }
+                    if os.path.exists(job["path"]):
+                        yield result(job, "skipped")
+                        continue
+                    heapq.heappush(scheduled, (job["started_at"], sequence, job))
+                    sequence += 1
+                    jobs += 1
+
+                # poll all due jobs
+                now = time.monotonic()
+                while (
+                    scheduled and scheduled[0][0] <= now and len(pending) < max_workers
+                ):
+                    job = heapq.heappop(scheduled)[2]
+                    future = executor.submit(
+                        self._poll_pdf, job["url"], job["path"], chunk_size
+                    )
+                    pending[future] = job
+
+                if not pending and not scheduled:
+                    return
+
+                timeout = None
+                if scheduled and len(pending) < max_workers:
+                    timeout = max(scheduled[0][0] - time.monotonic(), 0)
+                if not pending:
+                    time.sleep(timeout)
+                    continue
+
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    error = future.exception()
+                    if error is None and future.result() is None:
+                        jobs -= 1
+                        yield result(job, "downloaded")
+                        continue
+                    if error is not None:
+                        jobs -= 1
+                        yield result(job, "failed", error)
+                        continue
+
+                    # still generating, poll again later
+                    interval = parse_retry_after(future.result().get("Retry-After"))
+                    if interval is None:
+                        interval = job["interval"]
+                        job["interval"] = min(job["interval"] * 2, max_interval)
+                    next_poll = time.monotonic() + interval
+                    if next_poll > job["started_at"] + deadline:
+                        jobs -= 1
+                        yield result(job, "failed", "PDF generation timed out")
+                        continue
+                    heapq.heappush(scheduled, (next_poll, sequence, job))
+                    sequence += 1
 
 
 class XbrlApi:
@@ -201,58 +578,131 @@ class XbrlApi:
     Base class for XBRL-to-JSON API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None, cache=None):
         self.api_key = api_key
         self.api_endpoint = xbrl_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
+        self.cache = cache
 
     def xbrl_to_json(self, htm_url="", xbrl_url="", accession_no=""):
         if len(htm_url) == 0 and len(xbrl_url) == 0 and len(accession_no) == 0:
             raise ValueError("htm_url, xbrl_url or accession_no must be present")
 
-        _url = ""
-        response = {}
+        parameter = ""
 
         if len(htm_url):
-            _url = self.api_endpoint + "&htm-url=" + htm_url
+            parameter = "&htm-url=" + htm_url
 
         if len(xbrl_url):
-            _url = self.api_endpoint + "&xbrl-url=" + xbrl_url
+            parameter = "&xbrl-url=" + xbrl_url
 
         if len(accession_no):
-            _url = self.api_endpoint + "&accession-no=" + accession_no
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(_url, proxies=self.proxies)
-
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                return data
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
+            parameter = "&accession-no=" + accession_no
+
+        if self.cache is not None:
+            key = "xbrl:" + re.sub(r"ix\?doc=/", "", parameter)
+            content = self.cache.get(key)
+            if content is not None:
+                return loads(content)
+
+        response = self.transport.get(
+            self.api_endpoint + parameter, proxies=self.proxies
+        )
+        if response.status_code != 200:
             handle_api_error(response)
 
+        if self.cache is not None:
+            self.cache.set(key, response.content)
+        return loads(response.content)
+
+    def build_panel(
+        self,
+        query_or_accession_numbers,
+        statements=None,
+        panel=None,
+        max_workers=8,
+        errors=None,
+    ):
+        """
+        Converts many filings to XBRL-JSON concurrently and merges their
+        numeric facts into a deduplicated company x concept x period
+        XbrlPanel as they complete.
+
+        query_or_accession_numbers is either a Query API query, e.g.
+        {"query": 'ticker:AAPL AND formType:"10-K"'}, whose filings are
+        discovered with QueryApi.iter_filings, or a list of accession
+        numbers. Pass an existing panel to add new filings only. Failed
+        conversions are skipped and appended to errors as
+        (accession_no, error) tuples if errors is a list.
+
+            panel = xbrlApi.build_panel(
+                {"query": 'ticker:(AAPL OR MSFT) AND formType:"10-K"'},
+                statements=["StatementsOfIncome", "BalanceSheets"],
+            )
+            df = panel.to_pandas()
+
+        Pass a DiskCache as cache to XbrlApi to keep the raw XBRL-JSON of
+        every filing when rebuilding panels.
+        """
+        panel = panel if panel is not None else XbrlPanel(statements)
+
+        if isinstance(query_or_accession_numbers, dict):
+            query_api = QueryApi(self.api_key, self.proxies, self.transport)
+            filings = query_api.iter_filings(query_or_accession_numbers)
+        else:
+            filings = ({"accessionNo": a} for a in query_or_accession_numbers)
+
+        def new_filings():
+            seen = set(panel.accession_numbers)
+            for filing in filings:
+                if filing["accessionNo"] in seen:
+                    continue
+                seen.add(filing["accessionNo"])
+                yield filing
+
+        def fetch(filing):
+            return self.xbrl_to_json(accession_no=filing["accessionNo"])
+
+        for filing, xbrl_json, error in iter_completed(
+            fetch, new_filings(), max_workers
+        ):
+            if error is not None:
+                if errors is not None:
+                    errors.append((filing["accessionNo"], error))
+                continue
+            panel.add(
+                xbrl_json,
+                filing.get("cik"),
+                filing["accessionNo"],
+                filing.get("filedAt"),
+            )
+        return panel
+
 
 class ExtractorApi:
     """
     Base class for 10-K/10-Q/8-K item/section extractor API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None, cache=None):
         self.api_key = api_key
         self.api_endpoint = extractor_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
+        self.cache = cache
 
     def get_section(self, filing_url="", section="1A", return_type="text"):
         if len(filing_url) == 0:
             raise ValueError("filing_url must be present")
 
-        response = {}
+        if self.cache is not None:
+            key = "extractor:" + re.sub(r"ix\?doc=/", "", filing_url)
+            key += ":" + section + ":" + return_type
+            value = self.cache.get(key)
+            if value is not None:
+                return value.decode("utf-8")
+
         _url = (
             self.api_endpoint
             + "&url="
@@ -263,20 +713,47 @@ class ExtractorApi:
             + return_type
         )
 
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(5):
-            response = requests.get(_url, proxies=self.proxies)
-
-            if response.status_code == 200:
-                return response.text
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
+        response = self.transport.get(_url, proxies=self.proxies, max_retries=5)
+        if response.status_code != 200:
             handle_api_error(response)
 
+        if self.cache is not None:
+            self.cache.set(key, response.text.encode("utf-8"))
+        return response.text
+
+    def get_sections(
+        self, filings, sections=("1A",), return_type="text", max_workers=8
+    ):
+        """
+        Extracts every section of every filing URL concurrently and yields
+        ((filing_url, section), result, error) tuples as they complete.
+
+        filings can be a lazy iterable, e.g. a generator over filing URLs.
+        Duplicate (filing_url, section) pairs are only extracted once. A
+        failed extraction is returned as error instead of aborting the batch.
+
+            for (url, section), text, error in extractorApi.get_sections(
+                urls, ["1", "1A", "7", "7A"]
+            ):
+                ...
+        """
+        if isinstance(sections, str):
+            sections = [sections]
+
+        def pairs():
+            seen = set()
+            for filing_url in filings:
+                for section in sections:
+                    if (filing_url, section) in seen:
+                        continue
+                    seen.add((filing_url, section))
+                    yield filing_url, section
+
+        def extract(pair):
+            return self.get_section(pair[0], pair[1], return_type)
+
+        return iter_completed(extract, pairs(), max_workers)
+
 
 class MappingApi:
     """
@@ -284,12 +761,16 @@ class MappingApi:
     Documentation: https://sec-api.io/docs/mapping-api
 
     cik, ticker, cusip, name, exchange, sector, industry
+
+    Pass a TTLCache as cache to memoize lookups in memory.
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None, cache=None):
         self.api_key = api_key
         self.api_endpoint = mapping_api_endpoint
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
+        self.cache = cache
         self.supported_parameters = [
             "cik",
             "ticker",
@@ -304,7 +785,14 @@ class MappingApi:
         if not parameter.lower() in self.supported_parameters:
             raise ValueError("Parameter not supported")
 
-        response = {}
+        if self.cache is not None:
+            return self.cache.get_or_load(
+                parameter.lower() + ":" + value,
+                lambda: self._resolve(parameter, value),
+            )
+        return self._resolve(parameter, value)
+
+    def _resolve(self, parameter, value):
         _url = (
             self.api_endpoint
             + "/"
@@ -315,19 +803,36 @@ class MappingApi:
             + self.api_key
         )
 
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(_url, proxies=self.proxies)
+        response = self.transport.get(_url, proxies=self.proxies)
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
+
+    def resolve_if_changed(self, parameter, value, etag=None):
+        """
+        Like resolve(), but sends etag as If-None-Match and bypasses the
+        cache. Returns (result, etag) with result None if the result has
+        not changed since etag was returned.
+        """
+        if not parameter.lower() in self.supported_parameters:
+            raise ValueError("Parameter not supported")
 
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        _url = (
+            self.api_endpoint
+            + "/"
+            + parameter.lower()
+            + "/"
+            + value
+            + "?token="
+            + self.api_key
+        )
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.transport.get(_url, headers=headers, proxies=self.proxies)
+        if response.status_code == 304:
+            return None, etag
+        if response.status_code == 200:
+            return loads(response.content), response.headers.get("ETag")
+        handle_api_error(response)
 
 
 class DirectorsBoardMembersApi:
@@ -336,28 +841,19 @@ class DirectorsBoardMembersApi:
     https://sec-api.io/docs/directors-and-board-members-data-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = directors_board_members_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class ExecCompApi:
@@ -366,10 +862,11 @@ class ExecCompApi:
     Documentation: https://sec-api.io/docs/executive-compensation-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = exec_comp_api_endpoint
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, parameter=""):
         if isinstance(parameter, str):
@@ -379,32 +876,18 @@ class ExecCompApi:
         else:
             raise Exception("Invalid parameter")
 
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            if http_method == "GET":
-                _url = (
-                    self.api_endpoint
-                    + "/"
-                    + parameter.upper()
-                    + "?token="
-                    + self.api_key
-                )
-                response = requests.get(_url, proxies=self.proxies)
-            else:
-                _url = self.api_endpoint + "?token=" + self.api_key
-                response = requests.post(_url, json=parameter, proxies=self.proxies)
-
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
+        if http_method == "GET":
+            _url = (
+                self.api_endpoint + "/" + parameter.upper() + "?token=" + self.api_key
+            )
+            response = self.transport.get(_url, proxies=self.proxies)
         else:
-            handle_api_error(response)
+            _url = self.api_endpoint + "?token=" + self.api_key
+            response = self.transport.post(_url, json=parameter, proxies=self.proxies)
+
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class InsiderTradingApi:
@@ -412,28 +895,31 @@ class InsiderTradingApi:
     Base class for Insider Trading Data API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = insider_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
+
+    def get_transactions(self, query):
+        """
+        Returns the transactions of all matching filings as flat
+        InsiderTransaction records instead of nested dicts. The response
+        is decoded one filing at a time, so the full response is never
+        held in memory as dicts.
+        """
+        filings = post_stream_array(
+            self.transport, self.api_endpoint, query, self.proxies, "transactions"
+        )
+        return list(insider_transactions(filings))
 
 
 class Form144Api:
@@ -442,26 +928,19 @@ class Form144Api:
     https://sec-api.io/docs/form-144-restricted-sales-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_144_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Form13FHoldingsApi:
@@ -470,28 +949,31 @@ class Form13FHoldingsApi:
     https://sec-api.io/docs/form-13-f-filings-institutional-holdings-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_13F_holdings_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
+
+    def get_holdings(self, query):
+        """
+        Returns the holdings of all matching filings as flat
+        Holding13F records instead of nested dicts. The response is
+        decoded one filing at a time, so the full response is never held
+        in memory as dicts.
+        """
+        filings = post_stream_array(
+            self.transport, self.api_endpoint, query, self.proxies, "data"
+        )
+        return list(holdings_13f(filings))
 
 
 class Form13FCoverPagesApi:
@@ -500,28 +982,19 @@ class Form13FCoverPagesApi:
     https://sec-api.io/docs/form-13-f-filings-institutional-holdings-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_13F_cover_pages_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class FormNportApi:
@@ -529,28 +1002,31 @@ class FormNportApi:
     Base class for Form NPORT API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_nport_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
+
+    def get_holdings(self, query):
+        """
+        Returns the investments of all matching filings as flat
+        NportHolding records instead of nested dicts. The response is
+        decoded one filing at a time, so the full response is never held
+        in memory as dicts.
+        """
+        filings = post_stream_array(
+            self.transport, self.api_endpoint, query, self.proxies, "filings"
+        )
+        return list(nport_holdings(filings))
 
 
 class FormCApi:
@@ -559,28 +1035,19 @@ class FormCApi:
     https://sec-api.io/docs/form-c-crowdfunding-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_C_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class FormDApi:
@@ -588,28 +1055,19 @@ class FormDApi:
     Base class for Form D API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_d_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class RegASearchAllApi:
@@ -618,26 +1076,19 @@ class RegASearchAllApi:
     https://sec-api.io/docs/reg-a-offering-statements-api#search-api-endpoint
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = reg_A_search_all_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Form1AApi:
@@ -646,26 +1097,19 @@ class Form1AApi:
     https://sec-api.io/docs/reg-a-offering-statements-api#form-1-a-offering-statements-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_1A_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Form1KApi:
@@ -674,26 +1118,19 @@ class Form1KApi:
     https://sec-api.io/docs/reg-a-offering-statements-api#form-1-k-annual-reports-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_1K_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Form1ZApi:
@@ -702,26 +1139,19 @@ class Form1ZApi:
     https://sec-api.io/docs/reg-a-offering-statements-api#form-1-z-exit-reports-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_1Z_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class FormAdvApi:
@@ -729,7 +1159,7 @@ class FormAdvApi:
     Base class for Form ADV API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint_firm = form_adv_endpoint + "/firm" + "?token=" + api_key
         self.api_endpoint_individual = (
@@ -737,40 +1167,21 @@ class FormAdvApi:
         )
         self.api_endpoint_brochures = form_adv_endpoint + "/brochures?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_firms(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint_firm, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint_firm, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
     def get_request_wrapper(self, api_endpoint):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(api_endpoint, proxies=self.proxies)
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(x + 1)
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.get(api_endpoint, proxies=self.proxies)
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
     def get_direct_owners(self, crd):
         api_endpoint = (
@@ -803,22 +1214,12 @@ class FormAdvApi:
         return self.get_request_wrapper(api_endpoint)
 
     def get_individuals(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint_individual, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint_individual, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
     def get_brochures(self, crd):
         api_endpoint = (
@@ -826,38 +1227,122 @@ class FormAdvApi:
         )
         return self.get_request_wrapper(api_endpoint)
 
+    def get_firm_profiles(self, crds, max_workers=10, batch_size=50):
+        """
+        Fetches the firm, direct owners, indirect owners, private funds and
+        brochures of many CRDs concurrently and yields one profile dict per
+        CRD as soon as all its parts are complete:
+
+            {"crd": 793, "firm": {...}, "directOwners": [...],
+             "indirectOwners": [...], "privateFunds": [...],
+             "brochures": {...}, "errors": {}}
+
+        Firms are looked up with one get_firms query per batch_size CRDs.
+        Parts that fail are None and their error is listed under errors.
+        max_workers defaults to the pool_maxsize of the default Transport,
+        raise both together so every worker keeps its connection alive.
+        """
+        schedules = {
+            "directOwners": self.get_direct_owners,
+            "indirectOwners": self.get_indirect_owners,
+            "privateFunds": self.get_private_funds,
+            "brochures": self.get_brochures,
+        }
+        profiles = {}
+        remaining = {}
+
+        def batches():
+            seen = set()
+            batch = []
+            for crd in crds:
+                if str(crd) in seen:
+                    continue
+                seen.add(str(crd))
+                batch.append(crd)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        def tasks():
+            for batch in batches():
+                for crd in batch:
+                    profiles[crd] = {"crd": crd, "firm": None, "errors": {}}
+                    profiles[crd].update(dict.fromkeys(schedules))
+                    remaining[crd] = len(schedules) + 1
+                yield "firm", batch
+                for crd in batch:
+                    for part in schedules:
+                        yield part, crd
+
+        def fetch(task):
+            part, value = task
+            if part != "firm":
+                return schedules[part](value)
+            response = self.get_firms(
+                {
+                    "query": "Info.FirmCrdNb:("
+                    + " OR ".join(str(crd) for crd in value)
+                    + ")",
+                    "from": "0",
+                    "size": str(len(value)),
+                }
+            )
+            return {
+                str(firm.get("Info", {}).get("FirmCrdNb")): firm
+                for firm in response.get("filings", [])
+            }
+
+        for (part, value), result, error in iter_completed(fetch, tasks(), max_workers):
+            for crd in value if part == "firm" else [value]:
+                profile = profiles[crd]
+                if error is not None:
+                    profile["errors"][part] = str(error)
+                elif part == "firm":
+                    profile["firm"] = result.get(str(crd))
+                else:
+                    profile[part] = result
+
+                remaining[crd] -= 1
+                if remaining[crd] == 0:
+                    del remaining[crd]
+                    yield profiles.pop(crd)
+
 
 class FloatApi:
     """
     Base class for Float API
+
+    Pass a TTLCache as cache to memoize lookups in memory.
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None, cache=None):
         self.api_key = api_key
         self.api_endpoint = float_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
+        self.cache = cache
 
     def get_float(self, ticker="", cik=""):
         if len(ticker) == 0 and len(cik) == 0:
             raise Exception("Invalid input")
 
-        response = {}
-
         search_term = "&ticker=" + ticker if len(ticker) else "&cik=" + cik
+
+        if self.cache is not None:
+            return self.cache.get_or_load(
+                search_term, lambda: self._get_float(search_term)
+            )
+        return self._get_float(search_term)
+
+    def _get_float(self, search_term):
         url = self.api_endpoint + search_term
 
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(url, proxies=self.proxies)
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.get(url, proxies=self.proxies)
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Form13DGApi:
@@ -865,28 +1350,19 @@ class Form13DGApi:
     Base class for Form 13D/13G API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_13D_13G_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class FormNcenApi:
@@ -895,27 +1371,19 @@ class FormNcenApi:
     https://sec-api.io/docs/form-ncen-api-annual-reports-investment-companies
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_NCEN_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class FormNPXApi:
@@ -924,46 +1392,163 @@ class FormNPXApi:
     https://sec-api.io/docs/form-npx-proxy-voting-records-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint_metadata = form_NPX_endpoint + "?token=" + api_key
         self.api_endpoint_records = (
             form_NPX_endpoint + "/<accessionNo>?token=" + api_key
         )
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_metadata(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint_metadata, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint_metadata, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
     def get_voting_records(self, accessionNo):
         api_endpoint = self.api_endpoint_records.replace("<accessionNo>", accessionNo)
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.get(api_endpoint, proxies=self.proxies)
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                time.sleep(0.5 * (x + 1))
-            else:
+        response = self.transport.get(api_endpoint, proxies=self.proxies)
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
+
+    def get_votes(self, accessionNo):
+        """
+        Returns the proxy voting records of a filing as flat
+        NpxVote records, one per vote, instead of nested dicts. The
+        response is decoded one voting record at a time.
+        """
+        records = self._stream_voting_records(accessionNo, 65536)
+        return list(npx_votes(records, accessionNo))
+
+    def _stream_voting_records(self, accessionNo, chunk_size):
+        api_endpoint = self.api_endpoint_records.replace("<accessionNo>", accessionNo)
+        response = self.transport.get(api_endpoint, proxies=self.proxies, stream=True)
+        with response:
+            if response.status_code != 200:
                 handle_api_error(response)
-        else:
-            handle_api_error(response)
+            for record in iter_json_array(
+                response.iter_content(chunk_size=chunk_size), "proxyVotingRecords"
+            ):
+                yield record
+
+    def iter_voting_records(
+        self, accessionNos, max_workers=4, max_queue_size=10000, chunk_size=65536
+    ):
+        """
+        Downloads the proxy voting records of many filings concurrently and
+        yields (accessionNo, record, error) tuples. accessionNos can be
+        accession numbers or the filings returned by get_metadata().
+
+        Responses are decoded incrementally while they are downloaded and at
+        most max_queue_size decoded records are buffered, so memory stays
+        bounded even for filings with hundreds of thousands of votes. If a
+        filing fails, (accessionNo, None, error) is yielded and the records
+        of the filing yielded before the error are not repeated.
+        """
+        records = queue.Queue(maxsize=max_queue_size)
+        stop = threading.Event()
+        finished = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    records.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def download(accessionNo):
+            try:
+                for record in self._stream_voting_records(accessionNo, chunk_size):
+                    if stop.is_set():
+                        return
+                    put((accessionNo, record, None))
+            except Exception as e:
+                put((accessionNo, None, e))
+            finally:
+                put((accessionNo, finished, None))
+
+        accessionNos = (
+            a.get("accessionNo") if isinstance(a, dict) else a for a in accessionNos
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            running = 0
+            for accessionNo in accessionNos:
+                executor.submit(download, accessionNo)
+                running += 1
+                if running < max_workers:
+                    continue
+                while running == max_workers:
+                    item = records.get()
+                    if item[1] is finished:
+                        running -= 1
+                    else:
+                        yield item
+
+            while running:
+                item = records.get()
+                if item[1] is finished:
+                    running -= 1
+                else:
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def iter_voting_record_batches(
+        self, accessionNos, batch_size=10000, max_workers=4, errors=None
+    ):
+        """
+        Downloads the proxy voting records of many filings concurrently and
+        yields them as pyarrow RecordBatches of up to batch_size votes with
+        the fields of NpxVote as columns. Failed filings are skipped and
+        appended to errors as (accessionNo, error) tuples if errors is a
+        list. Requires pyarrow.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                "Arrow batches require pyarrow. Install it with: pip install pyarrow"
+            )
+
+        numeric = ("sharesVoted", "sharesOnLoan", "voteSharesVoted")
+        schema = pyarrow.schema(
+            [
+                (name, pyarrow.float64() if name in numeric else pyarrow.string())
+                for name in NpxVote.__slots__
+            ]
+        )
+
+        def to_batch(votes):
+            return pyarrow.RecordBatch.from_pydict(
+                {
+                    name: [getattr(vote, name) for vote in votes]
+                    for name in NpxVote.__slots__
+                },
+                schema=schema,
+            )
+
+        votes = []
+        for accessionNo, record, error in self.iter_voting_records(
+            accessionNos, max_workers
+        ):
+            if error is not None:
+                if errors is not None:
+                    errors.append((accessionNo, error))
+                continue
+            votes.extend(npx_votes([record], accessionNo))
+            if len(votes) >= batch_size:
+                yield to_batch(votes)
+                votes = []
+        if votes:
+            yield to_batch(votes)
 
 
 class Form_S1_424B4_Api:
@@ -971,28 +1556,19 @@ class Form_S1_424B4_Api:
     Base class for Form S1/424B4 API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_S1_424B4_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class SubsidiaryApi:
@@ -1000,28 +1576,19 @@ class SubsidiaryApi:
     Base class for Subsidiary API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = subsidiary_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class SecEnforcementActionsApi:
@@ -1030,28 +1597,19 @@ class SecEnforcementActionsApi:
     https://sec-api.io/docs/sec-enforcement-actions-database-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_search_endpoint = sec_enforcement_actions + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_search_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_search_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class SecLitigationsApi:
@@ -1060,28 +1618,19 @@ class SecLitigationsApi:
     https://sec-api.io/docs/sec-litigation-releases-database-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_search_endpoint = sec_litigations_search_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_search_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_search_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class SecAdministrativeProceedingsApi:
@@ -1090,30 +1639,21 @@ class SecAdministrativeProceedingsApi:
     https://sec-api.io/docs/sec-administrative-proceedings-database-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_search_endpoint = (
             sec_administrative_proceedings_endpoint + "?token=" + api_key
         )
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_search_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_search_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class AaerApi:
@@ -1122,28 +1662,19 @@ class AaerApi:
     https://sec-api.io/docs/aaer-database-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_search_endpoint = aaer_search_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_search_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_search_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class SroFilingsApi:
@@ -1152,28 +1683,19 @@ class SroFilingsApi:
     https://sec-api.io/docs/sro-filings-database-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_search_endpoint = sro_search_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_search_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_search_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Form_8K_Item_X_Api:
@@ -1181,28 +1703,19 @@ class Form_8K_Item_X_Api:
     Base class for Form 8-K Item X API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_8K_item_x_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class Item_4_02_Api:
@@ -1210,28 +1723,19 @@ class Item_4_02_Api:
     Base class for Form 8-K Item 4.02 API
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = form_8K_item_4_02_api_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
 
 
 class EdgarEntitiesApi:
@@ -1240,25 +1744,16 @@ class EdgarEntitiesApi:
     https://sec-api.io/docs/edgar-entities-database-api
     """
 
-    def __init__(self, api_key, proxies=None):
+    def __init__(self, api_key, proxies=None, transport=None):
         self.api_key = api_key
         self.api_endpoint = edgar_entities_endpoint + "?token=" + api_key
         self.proxies = proxies if proxies else {}
+        self.transport = transport if transport else get_default_transport()
 
     def get_data(self, query):
-        response = {}
-
-        # use backoff strategy to handle "too many requests" error.
-        for x in range(3):
-            response = requests.post(
-                self.api_endpoint, json=query, proxies=self.proxies
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                # wait 500 * (x + 1) milliseconds and try again
-                time.sleep(0.5 * (x + 1))
-            else:
-                handle_api_error(response)
-        else:
-            handle_api_error(response)
+        response = self.transport.post(
+            self.api_endpoint, json=query, proxies=self.proxies
+        )
+        if response.status_code == 200:
+            return loads(response.content)
+        handle_api_error(response)
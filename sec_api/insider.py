@@ -0,0 +1,322 @@
+"""
+Streaming flattener and vectorized aggregates for insider transactions
+(Form 3, 4 and 5).
+
+Requires numpy: pip install sec-api[numpy]
+
+    from sec_api import InsiderTradingApi, InsiderTransactionStore
+
+    insiderTradingApi = InsiderTradingApi("YOUR_API_KEY")
+    store = InsiderTransactionStore.from_api(
+        insiderTradingApi,
+        {"query": "documentType:4"},
+        start="2024-01-01",
+        end="2024-12-31",
+    )
+
+    # net open market purchases minus sales per issuer
+    net = store.net_by_issuer()
+"""
+
+from array import array
+
+from sec_api.bulk import BulkExporter
+from sec_api.columnar import ColumnarStore, _day_number, _import_numpy
+from sec_api.models import insider_transactions
+
+
+def iter_transactions(api, query, start=None, end=None, max_workers=4):
+    """
+    Yields an InsiderTransaction for every transaction of all Form 3/4/5
+    filings matching query, filed between start and end. Filings are
+    paginated with BulkExporter and flattened one at a time, so memory
+    stays bounded regardless of the number of results.
+    """
+    exporter = BulkExporter(api, max_workers=max_workers, records_key="transactions")
+    for filing in exporter.iter_records(query, start, end):
+        for transaction in insider_transactions([filing]):
+            yield transaction
+
+
+class InsiderTransactionStore(ColumnarStore):
+    """
+    Insider transactions stored as typed columns: issuer and owner
+    (integer codes), transaction date (datetime64[D]), transaction code,
+    derivative flag, signed shares (negative for dispositions) and price
+    per share (float64). Aggregates run vectorized on numpy arrays.
+
+    Filings are deduplicated by accession number. Transactions without
+    a transaction date use the period of report.
+    """
+
+    records_key = "transactions"
+    date_columns = ("date",)
+
+    def __init__(self):
+        super().__init__()
+        self._issuer_codes = {}
+        self._issuers = []
+        self._owner_codes = {}
+        self._owners = []
+        self._code_codes = {}
+        self._codes = []
+        self._data = {
+            "issuer": array("q"),
+            "owner": array("q"),
+            "date": array("q"),
+            "code": array("q"),
+            "derivative": array("b"),
+            "shares": array("d"),
+            "price": array("d"),
+        }
+
+    @classmethod
+    def from_api(cls, api, query, start=None, end=None, max_workers=4):
+        """
+        Loads all transactions of the filings matching query, filed between
+        start and end, from an InsiderTradingApi
+        """
+        store = cls()
+        store.add(iter_transactions(api, query, start, end, max_workers))
+        return store
+
+    def _convert(self, filings):
+        return insider_transactions(filings)
+
+    def _encode(self, codes, values, key, value):
+        code = codes.get(key)
+        if code is None:
+            code = len(values)
+            codes[key] = code
+            values.append(value)
+        return code
+
+    def _append(self, record):
+        data = self._data
+        issuer_cik = str(record.issuerCik or "").lstrip("0")
+        owner_cik = str(record.ownerCik or "").lstrip("0")
+        data["issuer"].append(
+            self._encode(
+                self._issuer_codes,
+                self._issuers,
+                issuer_cik,
+                (issuer_cik, record.issuerTicker, record.issuerName),
+            )
+        )
+        data["owner"].append(
+            self._encode(
+                self._owner_codes,
+                self._owners,
+                owner_cik,
+                (owner_cik, record.ownerName),
+            )
+        )
+        data["date"].append(
+            _day_number(record.transactionDate or record.periodOfReport)
+        )
+        data["code"].append(
+            self._encode(self._code_codes, self._codes, record.code, record.code)
+        )
+        data["derivative"].append(1 if record.derivative else 0)
+
+        shares = record.shares if record.shares is not None else 0.0
+        data["shares"].append(-shares if record.acquiredDisposedCode == "D" else shares)
+        price = record.pricePerShare
+        data["price"].append(price if price is not None else float("nan"))
+
+    def _mask(self, start, end, codes, include_derivative):
+        numpy = _import_numpy()
+        columns = self.arrays()
+        mask = numpy.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= columns["date"] >= numpy.datetime64(str(start)[:10], "D")
+        if end is not None:
+            mask &= columns["date"] <= numpy.datetime64(str(end)[:10], "D")
+        if codes is not None:
+            selected = [
+                self._code_codes[code] for code in codes if code in self._code_codes
+            ]
+            mask &= numpy.isin(columns["code"], selected)
+        if not include_derivative:
+            mask &= columns["derivative"] == 0
+        return mask
+
+    def _aggregate(self, keys, mask):
+        """
+        Sums shares and value of the selected transactions per key.
+        Returns the unique keys, net shares, net value, number of
+        purchases (acquisitions) and sales (dispositions).
+        """
+        numpy = _import_numpy()
+        columns = self.arrays()
+        shares = columns["shares"][mask]
+        value = shares * numpy.nan_to_num(columns["price"][mask])
+
+        keys, inverse = numpy.unique(keys[mask], return_inverse=True)
+        size = len(keys)
+        return (
+            keys,
+            numpy.bincount(inverse, shares, size),
+            numpy.bincount(inverse, value, size),
+            numpy.bincount(inverse[shares > 0], minlength=size),
+            numpy.bincount(inverse[shares < 0], minlength=size),
+        )
+
+    def _issuer_columns(self, codes):
+        numpy = _import_numpy()
+        issuers = numpy.array(self._issuers + [(None, None, None)], dtype=object)
+        return {
+            "issuerCik": issuers[codes, 0],
+            "issuerTicker": issuers[codes, 1],
+            "issuerName": issuers[codes, 2],
+        }
+
+    def _sorted(self, result, by):
+        numpy = _import_numpy()
+        order = numpy.argsort(-result[by], kind="stable")
+        return {name: column[order] for name, column in result.items()}
+
+    def net_by_issuer(
+        self, start=None, end=None, codes=("P", "S"), include_derivative=False
+    ):
+        """
+        Returns the net shares and value of transactions between start and
+        end per issuer as a dict of arrays issuerCik, issuerTicker,
+        issuerName, net_shares, net_value, purchases, sales and insiders
+        (number of distinct insiders), sorted by net_value (descending).
+
+        codes: transaction codes to include, defaults to open market
+            purchases (P) and sales (S). None includes all transactions.
+        """
+        numpy = _import_numpy()
+        columns = self.arrays()
+        mask = self._mask(start, end, codes, include_derivative)
+        issuers, shares, value, purchases, sales = self._aggregate(
+            columns["issuer"], mask
+        )
+
+        # distinct (issuer, owner) pairs counted per issuer
+        size = max(len(self._owners), 1)
+        pairs = numpy.unique(columns["issuer"][mask] * size + columns["owner"][mask])
+        insiders = numpy.bincount(
+            numpy.searchsorted(issuers, pairs // size), minlength=len(issuers)
+        )
+
+        result = self._issuer_columns(issuers)
+        result.update(
+            net_shares=shares,
+            net_value=value,
+            purchases=purchases,
+            sales=sales,
+            insiders=insiders,
+        )
+        return self._sorted(result, "net_value")
+
+    def net_by_insider(
+        self, start=None, end=None, codes=("P", "S"), include_derivative=False
+    ):
+        """
+        Returns the net shares and value of transactions between start and
+        end per insider and issuer as a dict of arrays ownerCik, ownerName,
+        issuerCik, issuerTicker, issuerName, net_shares, net_value,
+        purchases and sales, sorted by net_value (descending)
+        """
+        numpy = _import_numpy()
+        columns = self.arrays()
+        mask = self._mask(start, end, codes, include_derivative)
+        size = max(len(self._issuers), 1)
+        keys, shares, value, purchases, sales = self._aggregate(
+            columns["owner"] * size + columns["issuer"], mask
+        )
+        owner_codes, issuer_codes = numpy.divmod(keys, size)
+
+        owners = numpy.array(self._owners + [(None, None)], dtype=object)
+        result = {
+            "ownerCik": owners[owner_codes, 0],
+            "ownerName": owners[owner_codes, 1],
+        }
+        result.update(self._issuer_columns(issuer_codes))
+        result.update(
+            net_shares=shares,
+            net_value=value,
+            purchases=purchases,
+            sales=sales,
+        )
+        return self._sorted(result, "net_value")
+
+    def net_by_window(
+        self,
+        days=30,
+        start=None,
+        end=None,
+        codes=("P", "S"),
+        include_derivative=False,
+    ):
+        """
+        Returns the net shares and value per issuer and window of days
+        days, counted from start (or the first transaction date), as a
+        dict of arrays window (first day), issuerCik, issuerTicker,
+        issuerName, net_shares, net_value, purchases and sales, sorted
+        by window and issuer
+        """
+        numpy = _import_numpy()
+        columns = self.arrays()
+        mask = self._mask(start, end, codes, include_derivative)
+        mask &= ~numpy.isnat(columns["date"])
+
+        dates = columns["date"].astype(numpy.int64)
+        origin = (
+            _day_number(start)
+            if start is not None
+            else (dates[mask].min() if mask.any() else 0)
+        )
+        windows = (dates - origin) // days
+
+        size = max(len(self._issuers), 1)
+        keys, shares, value, purchases, sales = self._aggregate(
+            windows * size + columns["issuer"], mask
+        )
+        window_numbers, issuer_codes = numpy.divmod(keys, size)
+
+        result = {
+            "window": (origin + window_numbers * days).astype("datetime64[D]"),
+        }
+        result.update(self._issuer_columns(issuer_codes))
+        result.update(
+            net_shares=shares,
+            net_value=value,
+            purchases=purchases,
+            sales=sales,
+        )
+        return result
+
+    def to_pandas(self):
+        """
+        Returns all transactions as a pandas DataFrame
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError(
+                "DataFrame conversion requires pandas. Install it with: pip install pandas"
+            )
+        numpy = _import_numpy()
+        columns = self.arrays()
+        issuers = numpy.array(self._issuers + [(None, None, None)], dtype=object)
+        owners = numpy.array(self._owners + [(None, None)], dtype=object)
+        return pandas.DataFrame(
+            {
+                "issuerCik": issuers[columns["issuer"], 0],
+                "issuerTicker": issuers[columns["issuer"], 1],
+                "ownerCik": owners[columns["owner"], 0],
+                "ownerName": owners[columns["owner"], 1],
+                "transactionDate": columns["date"].astype("datetime64[ns]"),
+                "code": pandas.Categorical(
+                    numpy.array(self._codes + [None], dtype=object)[columns["code"]]
+                ),
+                "derivative": columns["derivative"].astype(bool),
+                "shares": columns["shares"],
+                "pricePerShare": columns["price"],
+                "value": columns["shares"] * columns["price"],
+            }
+        )
@@ -0,0 +1,314 @@
+import bisect
+import json
+import mmap
+import os
+import re
+
+from sec_api.decoding import loads
+from sec_api.utils import iter_completed
+
+default_exchanges = ["NASDAQ", "NYSE", "NYSEMKT", "NYSEARCA", "BATS", "OTC"]
+
+
+def _normalize(parameter, value):
+    value = str(value).strip()
+    if parameter == "cik":
+        return value.lstrip("0")
+    if parameter == "name":
+        return re.sub(r"\s+", " ", value.lower())
+    return value.upper()
+
+
+def _trigrams(text):
+    text = "  " + text + " "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class MappingIndex:
+    """
+    Local, offline index of the CUSIP/CIK/ticker mapping universe.
+
+    A one-time snapshot of all companies listed on the given exchanges is
+    downloaded with MappingApi and stored in a JSON lines file (path) that
+    is memory-mapped on load. Hash maps from cik, ticker, cusip, exchange,
+    sector, industry and name to record offsets are persisted next to it
+    (path + ".idx"), so exact lookups are dictionary lookups and never hit
+    the network. Names can also be searched by prefix or by similarity
+    (trigrams).
+
+    The sidecar only holds keys and integer offsets and is loaded into
+    memory as a whole, because every lookup needs the hash maps; record
+    bodies stay in the memory-mapped data file and are decoded on demand.
+
+        from sec_api import MappingApi, MappingIndex
+
+        mappingApi = MappingApi("YOUR_API_KEY")
+        index = MappingIndex.build(mappingApi, "mapping.jsonl")
+
+        # later, e.g. in another process
+        index = MappingIndex("mapping.jsonl")
+        index.lookup("cusip", "037833100")
+        index.search_name("apple")
+
+        # apply new, changed and delisted companies
+        index.refresh(mappingApi)
+
+    The index is not safe to read while it is refreshed.
+    """
+
+    parameters = ["cik", "ticker", "cusip", "name", "exchange", "sector", "industry"]
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".idx"
+        self._ids = {}
+        self._keys = {parameter: {} for parameter in self.parameters}
+        self._etags = {}
+        self._mmap = None
+        self._sorted_names = None
+        self._trigram_index = None
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as f:
+                data = loads(f.read())
+            self._ids = data["ids"]
+            self._keys = data["keys"]
+            self._etags = data.get("etags", {})
+        self._open()
+
+    @classmethod
+    def build(cls, mapping_api, path, exchanges=None, max_workers=4):
+        """
+        Downloads the mapping records of all exchanges into a new index at path
+        """
+        for file_path in (path, path + ".idx"):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        index = cls(path)
+        index.refresh(mapping_api, exchanges, max_workers)
+        return index
+
+    def _open(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _read(self, offset):
+        end = self._mmap.find(b"\n", offset)
+        return loads(self._mmap[offset : end if end != -1 else None])
+
+    def _record_id(self, record):
+        if record.get("id"):
+            return str(record["id"])
+        return "|".join(
+            str(record.get(key, "")) for key in ("cik", "ticker", "cusip", "name")
+        )
+
+    def _key_values(self, parameter, record):
+        value = record.get(parameter)
+        if value is None or value == "":
+            return []
+        if parameter == "cusip":
+            # records can list several CUSIPs separated by spaces
+            return [_normalize(parameter, v) for v in str(value).split()]
+        return [_normalize(parameter, value)]
+
+    def _add_keys(self, record, offset):
+        for parameter in self.parameters:
+            for value in self._key_values(parameter, record):
+                self._keys[parameter].setdefault(value, []).append(offset)
+
+    def _remove_keys(self, record, offset):
+        for parameter in self.parameters:
+            for value in self._key_values(parameter, record):
+                offsets = self._keys[parameter].get(value, [])
+                if offset in offsets:
+                    offsets.remove(offset)
+                if not offsets:
+                    self._keys[parameter].pop(value, None)
+
+    def refresh(self, mapping_api, exchanges=None, max_workers=4):
+        """
+        Applies the changes of the mapping universe to the index: new and
+        changed records are appended, records no longer listed on a
+        refreshed exchange are removed. Returns the number of added,
+        updated or removed records.
+
+        The Mapping API has no change feed, so every exchange is requested
+        again, but with the ETag of the last refresh: exchanges that have
+        not changed are answered with 304 Not Modified and skipped.
+        """
+        exchanges = exchanges if exchanges else default_exchanges
+
+        def fetch(exchange):
+            if hasattr(mapping_api, "resolve_if_changed"):
+                return mapping_api.resolve_if_changed(
+                    "exchange", exchange, self._etags.get(exchange)
+                )
+            return mapping_api.resolve("exchange", exchange), None
+
+        changed = 0
+        seen = set()
+        refreshed = []
+        etags = {}
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            for exchange, (records, etag), error in iter_completed(
+                fetch, exchanges, max_workers
+            ):
+                if error is not None:
+                    raise error
+                etags[exchange] = etag
+                if records is None:
+                    # not modified since the last refresh
+                    continue
+                refreshed.append(exchange)
+                for record in records:
+                    line = json.dumps(record, sort_keys=True).encode("utf-8")
+                    record_id = self._record_id(record)
+                    # companies can be listed in several snapshots
+                    if record_id in seen:
+                        continue
+                    seen.add(record_id)
+
+                    previous_offset = self._ids.get(record_id)
+                    if previous_offset is not None:
+                        previous = self._read(previous_offset)
+                        if json.dumps(previous, sort_keys=True).encode() == line:
+                            continue
+                        self._remove_keys(previous, previous_offset)
+
+                    f.write(line + b"\n")
+                    self._ids[record_id] = offset
+                    self._add_keys(record, offset)
+                    offset += len(line) + 1
+                    changed += 1
+
+        # the data file has grown, remap it before reading removed records
+        self._open()
+        changed += self._remove_missing(refreshed, seen)
+
+        for exchange, etag in etags.items():
+            if etag:
+                self._etags[exchange] = etag
+            else:
+                self._etags.pop(exchange, None)
+        self._save_index()
+        self._sorted_names = None
+        self._trigram_index = None
+        return changed
+
+    def _remove_missing(self, exchanges, seen):
+        """
+        Removes the records of exchanges that are not in seen, i.e. that
+        were delisted or left the exchange. Returns the number of removed
+        records.
+        """
+        offset_ids = {offset: record_id for record_id, offset in self._ids.items()}
+        removed = 0
+        for exchange in exchanges:
+            offsets = self._keys["exchange"].get(_normalize("exchange", exchange), [])
+            for offset in list(offsets):
+                record_id = offset_ids.get(offset)
+                if record_id is None or record_id in seen:
+                    continue
+                self._remove_keys(self._read(offset), offset)
+                del self._ids[record_id]
+                removed += 1
+        return removed
+
+    def _save_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"ids": self._ids, "keys": self._keys, "etags": self._etags}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def compact(self):
+        """
+        Rewrites the data file without outdated versions of updated and
+        removed records
+        """
+        records = [self._read(offset) for offset in self._ids.values()]
+        self.close()
+
+        self._ids = {}
+        self._keys = {parameter: {} for parameter in self.parameters}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for record in records:
+                offset = f.tell()
+                f.write(json.dumps(record, sort_keys=True).encode("utf-8") + b"\n")
+                self._ids[self._record_id(record)] = offset
+                self._add_keys(record, offset)
+        os.replace(tmp_path, self.path)
+
+        self._save_index()
+        self._open()
+        self._sorted_names = None
+        self._trigram_index = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    def lookup(self, parameter, value):
+        """
+        Returns all records matching value exactly, e.g.
+        lookup("ticker", "AAPL"), same as MappingApi.resolve() but offline
+        """
+        parameter = parameter.lower()
+        if parameter not in self._keys:
+            raise ValueError("Parameter not supported")
+        offsets = self._keys[parameter].get(_normalize(parameter, value), [])
+        return [self._read(offset) for offset in offsets]
+
+    def search_name(self, prefix, limit=20):
+        """
+        Returns up to limit records whose name starts with prefix
+        """
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._keys["name"])
+
+        prefix = _normalize("name", prefix)
+        results = []
+        i = bisect.bisect_left(self._sorted_names, prefix)
+        while i < len(self._sorted_names) and len(results) < limit:
+            name = self._sorted_names[i]
+            if not name.startswith(prefix):
+                break
+            for offset in self._keys["name"][name]:
+                results.append(self._read(offset))
+            i += 1
+        return results[:limit]
+
+    def search_name_fuzzy(self, text, limit=20):
+        """
+        Returns up to limit records whose name is most similar to text,
+        ranked by the number of shared trigrams
+        """
+        if self._trigram_index is None:
+            self._trigram_index = {}
+            for name in self._keys["name"]:
+                for trigram in _trigrams(name):
+                    self._trigram_index.setdefault(trigram, []).append(name)
+
+        scores = {}
+        for trigram in _trigrams(_normalize("name", text)):
+            for name in self._trigram_index.get(trigram, []):
+                scores[name] = scores.get(name, 0) + 1
+
+        names = sorted(scores, key=lambda name: (-scores[name], len(name)))
+        results = []
+        for name in names:
+            for offset in self._keys["name"][name]:
+                results.append(self._read(offset))
+            if len(results) >= limit:
+                break
+        return results[:limit]
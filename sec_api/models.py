@@ -0,0 +1,367 @@
+"""
+Typed record models for high-volume API responses.
+
+Each model is a flat object with __slots__ instead of a nested dict, so
+millions of records take a fraction of the memory and attributes are
+read without dict lookups. Numbers are converted to int/float, dates are
+kept as ISO strings.
+
+    from sec_api import InsiderTradingApi
+
+    insiderTradingApi = InsiderTradingApi("YOUR_API_KEY")
+    transactions = insiderTradingApi.get_transactions(
+        {"query": "issuer.tradingSymbol:TSLA"}
+    )
+    transactions[0].shares
+"""
+
+
+def _get(data, *keys):
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _float(value):
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value):
+    value = _float(value)
+    return int(value) if value is not None else None
+
+
+class Record:
+    """
+    Base class of all record models. Fields are listed in __slots__,
+    missing fields are None. Records compare and hash by value; don't
+    modify a record while it is used in a set or as a dict key.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+        for name in self.__slots__[len(args) :]:
+            setattr(self, name, kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError("Unknown fields: " + ", ".join(kwargs))
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(
+            (type(self),) + tuple(getattr(self, name) for name in self.__slots__)
+        )
+
+    def __repr__(self):
+        fields = ", ".join(
+            name + "=" + repr(getattr(self, name)) for name in self.__slots__
+        )
+        return type(self).__name__ + "(" + fields + ")"
+
+
+class InsiderTransaction(Record):
+    """
+    One non-derivative or derivative transaction of a Form 3/4/5 filing
+    """
+
+    __slots__ = (
+        "accessionNo",
+        "filedAt",
+        "documentType",
+        "periodOfReport",
+        "issuerCik",
+        "issuerName",
+        "issuerTicker",
+        "ownerCik",
+        "ownerName",
+        "isDirector",
+        "isOfficer",
+        "officerTitle",
+        "isTenPercentOwner",
+        "isOther",
+        "derivative",
+        "securityTitle",
+        "transactionDate",
+        "code",
+        "shares",
+        "pricePerShare",
+        "acquiredDisposedCode",
+        "sharesOwnedFollowingTransaction",
+        "directOrIndirectOwnership",
+    )
+
+
+class Holding13F(Record):
+    """
+    One holding of a Form 13F filing
+    """
+
+    __slots__ = (
+        "accessionNo",
+        "filedAt",
+        "cik",
+        "companyName",
+        "periodOfReport",
+        "nameOfIssuer",
+        "titleOfClass",
+        "cusip",
+        "ticker",
+        "value",
+        "shares",
+        "sharesType",
+        "putCall",
+        "investmentDiscretion",
+        "otherManager",
+        "votingSole",
+        "votingShared",
+        "votingNone",
+    )
+
+
+class NportHolding(Record):
+    """
+    One investment or security (invstOrSecs) of a Form N-PORT filing
+    """
+
+    __slots__ = (
+        "accessionNo",
+        "filedAt",
+        "cik",
+        "seriesId",
+        "seriesName",
+        "repPdEnd",
+        "repPdDate",
+        "name",
+        "title",
+        "lei",
+        "cusip",
+        "isin",
+        "balance",
+        "units",
+        "curCd",
+        "valUSD",
+        "pctVal",
+        "payoffProfile",
+        "assetCat",
+        "issuerCat",
+        "invCountry",
+        "fairValLevel",
+    )
+
+
+class NpxVote(Record):
+    """
+    One vote of a Form N-PX proxy voting record
+    """
+
+    __slots__ = (
+        "accessionNo",
+        "issuerName",
+        "cusip",
+        "isin",
+        "figi",
+        "meetingDate",
+        "voteDescription",
+        "voteCategories",
+        "sharesVoted",
+        "sharesOnLoan",
+        "howVoted",
+        "voteSharesVoted",
+        "managementRecommendation",
+        "voteSeries",
+    )
+
+
+def _list(value):
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def insider_transactions(response):
+    """
+    Yields an InsiderTransaction for every transaction of an
+    InsiderTradingApi.get_data() response or list of filings
+    """
+    filings = (
+        response.get("transactions", []) if isinstance(response, dict) else response
+    )
+
+    for filing in filings:
+        owner = filing.get("reportingOwner") or {}
+        relationship = owner.get("relationship") or {}
+        context = (
+            filing.get("accessionNo"),
+            filing.get("filedAt"),
+            filing.get("documentType"),
+            filing.get("periodOfReport"),
+            _get(filing, "issuer", "cik"),
+            _get(filing, "issuer", "name"),
+            _get(filing, "issuer", "tradingSymbol"),
+            owner.get("cik"),
+            owner.get("name"),
+            relationship.get("isDirector"),
+            relationship.get("isOfficer"),
+            relationship.get("officerTitle"),
+            relationship.get("isTenPercentOwner"),
+            relationship.get("isOther"),
+        )
+
+        for table, derivative in (
+            ("nonDerivativeTable", False),
+            ("derivativeTable", True),
+        ):
+            for transaction in _list(_get(filing, table, "transactions")):
+                amounts = transaction.get("amounts") or {}
+                yield InsiderTransaction(
+                    *context,
+                    derivative,
+                    transaction.get("securityTitle"),
+                    transaction.get("transactionDate"),
+                    _get(transaction, "coding", "code"),
+                    _float(amounts.get("shares")),
+                    _float(amounts.get("pricePerShare")),
+                    amounts.get("acquiredDisposedCode"),
+                    _float(
+                        _get(
+                            transaction,
+                            "postTransactionAmounts",
+                            "sharesOwnedFollowingTransaction",
+                        )
+                    ),
+                    _get(transaction, "ownershipNature", "directOrIndirectOwnership"),
+                )
+
+
+def holdings_13f(response):
+    """
+    Yields a Holding13F for every holding of a
+    Form13FHoldingsApi.get_data() response or list of filings
+    """
+    filings = response.get("data", []) if isinstance(response, dict) else response
+
+    for filing in filings:
+        context = (
+            filing.get("accessionNo"),
+            filing.get("filedAt"),
+            filing.get("cik"),
+            filing.get("companyName"),
+            filing.get("periodOfReport"),
+        )
+        for holding in _list(filing.get("holdings")):
+            voting = holding.get("votingAuthority") or {}
+            yield Holding13F(
+                *context,
+                holding.get("nameOfIssuer"),
+                holding.get("titleOfClass"),
+                holding.get("cusip"),
+                holding.get("ticker"),
+                _int(holding.get("value")),
+                _int(_get(holding, "shrsOrPrnAmt", "sshPrnamt")),
+                _get(holding, "shrsOrPrnAmt", "sshPrnamtType"),
+                holding.get("putCall"),
+                holding.get("investmentDiscretion"),
+                holding.get("otherManager"),
+                _int(voting.get("Sole")),
+                _int(voting.get("Shared")),
+                _int(voting.get("None")),
+            )
+
+
+def nport_holdings(response):
+    """
+    Yields an NportHolding for every investment of a
+    FormNportApi.get_data() response or list of filings
+    """
+    filings = response.get("filings", []) if isinstance(response, dict) else response
+
+    for filing in filings:
+        info = filing.get("genInfo") or {}
+        context = (
+            filing.get("accessionNo"),
+            filing.get("filedAt"),
+            info.get("regCik") or filing.get("cik"),
+            info.get("seriesId"),
+            info.get("seriesName"),
+            info.get("repPdEnd"),
+            info.get("repPdDate"),
+        )
+        for security in _list(filing.get("invstOrSecs")):
+            yield NportHolding(
+                *context,
+                security.get("name"),
+                security.get("title"),
+                security.get("lei"),
+                security.get("cusip"),
+                _get(security, "identifiers", "isin", "value"),
+                _float(security.get("balance")),
+                security.get("units"),
+                security.get("curCd"),
+                _float(security.get("valUSD")),
+                _float(security.get("pctVal")),
+                security.get("payoffProfile"),
+                security.get("assetCat"),
+                security.get("issuerCat"),
+                security.get("invCountry"),
+                security.get("fairValLevel"),
+            )
+
+
+def npx_votes(response, accession_no=None):
+    """
+    Yields an NpxVote for every vote of a FormNPXApi.get_voting_records()
+    response or list of proxy voting records
+    """
+    if isinstance(response, dict):
+        accession_no = accession_no or response.get("accessionNo")
+        records = response.get("proxyVotingRecords", [])
+    else:
+        records = response
+
+    for record in records:
+        categories = [
+            category.get("categoryType")
+            for category in _list(_get(record, "voteCategories", "voteCategory"))
+            if isinstance(category, dict)
+        ]
+        context = (
+            accession_no,
+            record.get("issuerName"),
+            record.get("cusip"),
+            record.get("isin"),
+            record.get("figi"),
+            record.get("meetingDate"),
+            record.get("voteDescription"),
+            ";".join(c for c in categories if c) or None,
+            _float(record.get("sharesVoted")),
+            _float(record.get("sharesOnLoan")),
+        )
+        votes = _list(_get(record, "vote", "voteRecord")) or [{}]
+        for vote in votes:
+            yield NpxVote(
+                *context,
+                vote.get("howVoted"),
+                _float(vote.get("sharesVoted")),
+                vote.get("managementRecommendation"),
+                record.get("voteSeries"),
+            )
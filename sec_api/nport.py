@@ -0,0 +1,216 @@
+"""
+Columnar loader for Form N-PORT portfolio holdings.
+
+Requires pyarrow: pip install sec-api[parquet]
+
+    from sec_api import FormNportApi, NportLoader
+
+    formNportApi = FormNportApi("YOUR_API_KEY")
+    loader = NportLoader(formNportApi)
+
+    # write all holdings of the funds reporting in Q1 2024, partitioned by
+    # reporting period: holdings/repPdEnd=2024-03-31/part-00000.parquet
+    loader.write_parquet(
+        {"query": "genInfo.repPdEnd:[2024-01-01 TO 2024-03-31]"},
+        "holdings",
+        start="2024-01-01",
+        end="2024-06-30",
+    )
+"""
+
+import os
+from array import array
+
+from sec_api.bulk import BulkExporter
+from sec_api.models import nport_holdings
+
+string_columns = [
+    "accessionNo",
+    "cik",
+    "seriesId",
+    "seriesName",
+    "name",
+    "title",
+    "lei",
+    "cusip",
+    "isin",
+]
+# columns with few distinct values are dictionary-encoded
+category_columns = [
+    "units",
+    "curCd",
+    "assetCat",
+    "issuerCat",
+    "invCountry",
+    "fairValLevel",
+]
+numeric_columns = ["balance", "valUSD", "pctVal"]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "NportLoader requires pyarrow. Install it with: pip install pyarrow"
+        )
+    return pyarrow
+
+
+class _Columns:
+    """
+    Column buffers of up to batch_size holdings
+    """
+
+    def __init__(self):
+        self.strings = {name: [] for name in string_columns + category_columns}
+        self.numbers = {name: array("d") for name in numeric_columns}
+        self.periods = []
+
+    def __len__(self):
+        return len(self.periods)
+
+    def append(self, holding):
+        for name, column in self.strings.items():
+            column.append(getattr(holding, name))
+        for name, column in self.numbers.items():
+            value = getattr(holding, name)
+            column.append(value if value is not None else float("nan"))
+        self.periods.append(holding.repPdEnd)
+
+    def to_batch(self):
+        pyarrow = _import_pyarrow()
+        arrays = {"repPdEnd": pyarrow.array(self.periods, pyarrow.string())}
+        arrays["repPdEnd"] = arrays["repPdEnd"].cast(pyarrow.date32())
+        for name in string_columns:
+            arrays[name] = pyarrow.array(self.strings[name], pyarrow.string())
+        for name in category_columns:
+            arrays[name] = pyarrow.array(
+                self.strings[name], pyarrow.string()
+            ).dictionary_encode()
+        for name in numeric_columns:
+            # float64 buffers are passed zero-copy, missing values are
+            # buffered as NaN and marked null in the validity bitmap
+            values = pyarrow.py_buffer(self.numbers[name])
+            size = len(self.numbers[name])
+            valid = pyarrow.compute.invert(
+                pyarrow.compute.is_nan(
+                    pyarrow.Array.from_buffers(pyarrow.float64(), size, [None, values])
+                )
+            )
+            arrays[name] = pyarrow.Array.from_buffers(
+                pyarrow.float64(), size, [valid.buffers()[1], values]
+            )
+        return pyarrow.RecordBatch.from_pydict(arrays)
+
+
+class NportLoader:
+    """
+    Pages through the N-PORT filings of a query with BulkExporter and
+    streams the investments (invstOrSecs) of every fund into pyarrow
+    RecordBatches of up to batch_size holdings with typed columns:
+    repPdEnd (date32), identifiers and names (string), balance, valUSD and
+    pctVal (float64, null if missing) and dictionary-encoded categories
+    such as assetCat. Only one batch per reporting period is buffered at a
+    time, so the full monthly N-PORT universe can be loaded or written to
+    Parquet with bounded memory.
+    """
+
+    def __init__(self, api, batch_size=100000, max_workers=4):
+        self.api = api
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def iter_holdings(self, query, start=None, end=None):
+        """
+        Yields an NportHolding for every investment of all N-PORT filings
+        matching query, filed between start and end
+        """
+        exporter = BulkExporter(
+            self.api, max_workers=self.max_workers, records_key="filings"
+        )
+        for filing in exporter.iter_records(query, start, end):
+            for holding in nport_holdings([filing]):
+                yield holding
+
+    def iter_batches(self, query, start=None, end=None):
+        """
+        Yields pyarrow RecordBatches of up to batch_size holdings of all
+        N-PORT filings matching query, filed between start and end
+        """
+        _import_pyarrow()
+        columns = _Columns()
+        for holding in self.iter_holdings(query, start, end):
+            columns.append(holding)
+            if len(columns) >= self.batch_size:
+                yield columns.to_batch()
+                columns = _Columns()
+        if len(columns):
+            yield columns.to_batch()
+
+    def to_arrow(self, query, start=None, end=None):
+        """
+        Returns all holdings of the N-PORT filings matching query, filed
+        between start and end, as a pyarrow Table
+        """
+        pyarrow = _import_pyarrow()
+        batches = list(self.iter_batches(query, start, end))
+        if not batches:
+            return _Columns().to_batch().schema.empty_table()
+        return pyarrow.Table.from_batches(batches).unify_dictionaries()
+
+    def write_parquet(self, query, path, start=None, end=None):
+        """
+        Writes the holdings of all N-PORT filings matching query, filed
+        between start and end, into one Parquet partition per reporting
+        period: path/repPdEnd=YYYY-MM-DD/part-00000.parquet. Every
+        partition file is written batch by batch. Returns a dict with the
+        number of holdings per reporting period.
+        """
+        pyarrow = _import_pyarrow()
+        buffers = {}
+        writers = {}
+        counts = {}
+
+        def flush(period):
+            batch = buffers.pop(period).to_batch().drop_columns(["repPdEnd"])
+            # dictionaries differ between batches, the files store plain strings
+            batch = pyarrow.RecordBatch.from_arrays(
+                [
+                    (
+                        column.dictionary_decode()
+                        if pyarrow.types.is_dictionary(column.type)
+                        else column
+                    )
+                    for column in batch.columns
+                ],
+                names=batch.schema.names,
+            )
+            if period not in writers:
+                directory = os.path.join(
+                    path, "repPdEnd=" + (period or "__HIVE_DEFAULT_PARTITION__")
+                )
+                os.makedirs(directory, exist_ok=True)
+                writers[period] = pyarrow.parquet.ParquetWriter(
+                    os.path.join(directory, "part-00000.parquet"), batch.schema
+                )
+            writers[period].write_batch(batch)
+
+        try:
+            for holding in self.iter_holdings(query, start, end):
+                period = holding.repPdEnd
+                columns = buffers.get(period)
+                if columns is None:
+                    columns = buffers[period] = _Columns()
+                columns.append(holding)
+                counts[period] = counts.get(period, 0) + 1
+                if len(columns) >= self.batch_size:
+                    flush(period)
+            for period in list(buffers):
+                flush(period)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        return counts
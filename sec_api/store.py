@@ -0,0 +1,263 @@
+"""
+Local SQLite store of filing metadata returned by QueryApi.
+
+    from sec_api import QueryApi, FilingStore
+
+    queryApi = QueryApi("YOUR_API_KEY")
+    store = FilingStore("filings.db", queryApi)
+
+    # ingest all 10-K filings of 2023
+    store.sync('formType:"10-K"', "2023-01-01", "2023-12-31")
+
+    # answered offline from the synced range
+    filings = store.find(ticker="AAPL", form_type="10-K", start="2023-01-01")
+"""
+
+import itertools
+import json
+import sqlite3
+import threading
+from datetime import date, timedelta
+
+from sec_api.bulk import BulkExporter, _to_datetime
+from sec_api.decoding import loads
+
+_schema = """
+CREATE TABLE IF NOT EXISTS filings (
+    accessionNo TEXT PRIMARY KEY,
+    cik TEXT,
+    ticker TEXT,
+    formType TEXT,
+    filedAt TEXT,
+    companyName TEXT,
+    periodOfReport TEXT,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS filings_cik ON filings (cik, filedAt);
+CREATE INDEX IF NOT EXISTS filings_ticker ON filings (ticker, filedAt);
+CREATE INDEX IF NOT EXISTS filings_form_type ON filings (formType, filedAt);
+CREATE INDEX IF NOT EXISTS filings_filed_at ON filings (filedAt);
+CREATE TABLE IF NOT EXISTS coverage (
+    query TEXT,
+    start TEXT,
+    end TEXT
+);
+CREATE INDEX IF NOT EXISTS coverage_query ON coverage (query);
+"""
+
+
+def _day(value):
+    return _to_datetime(value).date()
+
+
+def _next_day(value):
+    return (_day(value) + timedelta(days=1)).isoformat()
+
+
+def _quote(value):
+    return '"' + str(value).replace('"', '\\"') + '"'
+
+
+class FilingStore:
+    """
+    SQLite store of filing metadata with indexes on cik, ticker,
+    formType, filedAt and accessionNo.
+
+    sync() ingests all filings of a query and date range and records the
+    range as covered. find() answers queries from the store; with a
+    query_api, date ranges not covered yet are fetched from the Query API
+    first, so repeated and overlapping queries only send requests for new
+    ranges. The current day is never marked as covered.
+    """
+
+    def __init__(self, path, query_api=None, max_workers=4):
+        self.path = path
+        self.query_api = query_api
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_schema)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def ingest(self, filings):
+        """
+        Inserts or replaces filings, returns the number of filings
+        """
+        rows = [
+            (
+                filing.get("accessionNo"),
+                str(filing.get("cik", "")).lstrip("0") or None,
+                filing.get("ticker") or None,
+                filing.get("formType"),
+                filing.get("filedAt"),
+                filing.get("companyName"),
+                filing.get("periodOfReport"),
+                json.dumps(filing),
+            )
+            for filing in filings
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO filings VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def _ranges(self, query):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT start, end FROM coverage WHERE query = ? ORDER BY start",
+                (query,),
+            ).fetchall()
+        return rows
+
+    def _add_coverage(self, query, start, end):
+        ranges = self._ranges(query) + [(start, end)]
+        ranges.sort()
+        merged = []
+        for lower, upper in ranges:
+            if merged and lower <= _next_day(merged[-1][1]):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], upper))
+            else:
+                merged.append((lower, upper))
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM coverage WHERE query = ?", (query,))
+            self._db.executemany(
+                "INSERT INTO coverage VALUES (?, ?, ?)",
+                [(query, lower, upper) for lower, upper in merged],
+            )
+
+    def missing_ranges(self, query, start, end, scopes=()):
+        """
+        Returns the (start, end) day ranges between start and end that are
+        not covered by a sync of query, of any query in scopes or of all
+        filings ("*:*")
+        """
+        ranges = []
+        for scope in set([query, "*:*"] + list(scopes)):
+            ranges += self._ranges(scope)
+        ranges.sort()
+
+        missing = []
+        lower = _day(start).isoformat()
+        end = _day(end).isoformat()
+        for covered_start, covered_end in ranges:
+            if covered_end < lower:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > lower:
+                missing.append(
+                    (lower, (_day(covered_start) - timedelta(1)).isoformat())
+                )
+            lower = max(lower, _next_day(covered_end))
+        if lower <= end:
+            missing.append((lower, end))
+        return missing
+
+    def sync(self, query="*:*", start=None, end=None, scopes=()):
+        """
+        Fetches all filings matching the Lucene query filed between start
+        and end (inclusive, YYYY-MM-DD) from the Query API, stores them and
+        marks the range as covered. Only missing ranges are fetched.
+        Returns the number of ingested filings.
+        """
+        if self.query_api is None:
+            raise ValueError("FilingStore needs a query_api to sync")
+
+        today = date.today()
+        end = _day(end) if end else today
+        start = _day(start) if start else end
+
+        exporter = BulkExporter(
+            self.query_api, max_workers=self.max_workers, records_key="filings"
+        )
+        count = 0
+        for lower, upper in self.missing_ranges(query, start, end, scopes):
+            batch = []
+            for filing in exporter.iter_records({"query": query}, lower, upper):
+                batch.append(filing)
+                if len(batch) >= 1000:
+                    count += self.ingest(batch)
+                    batch = []
+            count += self.ingest(batch)
+
+            # filings of the current day are still coming in
+            covered_end = min(_day(upper), today - timedelta(days=1))
+            if covered_end >= _day(lower):
+                self._add_coverage(query, lower, covered_end.isoformat())
+        return count
+
+    def find(
+        self,
+        cik=None,
+        ticker=None,
+        form_type=None,
+        start=None,
+        end=None,
+        limit=None,
+        order="desc",
+    ):
+        """
+        Returns the filings matching cik, ticker and form_type filed
+        between start and end (inclusive, YYYY-MM-DD), sorted by filedAt.
+        Ranges not covered yet are fetched from the Query API first if the
+        store has a query_api.
+        """
+        end = _day(end) if end else date.today()
+        start = _day(start) if start else end - timedelta(days=365)
+
+        conditions = []
+        lucene = []
+        params = []
+        if cik is not None:
+            conditions.append("cik = ?")
+            params.append(str(cik).lstrip("0"))
+            lucene.append("cik:" + _quote(str(cik).lstrip("0")))
+        if ticker is not None:
+            conditions.append("ticker = ?")
+            params.append(ticker)
+            lucene.append("ticker:" + _quote(ticker))
+        if form_type is not None:
+            conditions.append("formType = ?")
+            params.append(form_type)
+            lucene.append("formType:" + _quote(form_type))
+
+        if self.query_api is not None:
+            # a sync of any subset of the conditions covers this query too,
+            # e.g. formType:"10-K" covers ticker:"AAPL" AND formType:"10-K"
+            scopes = [
+                " AND ".join(terms)
+                for n in range(1, len(lucene))
+                for terms in itertools.combinations(lucene, n)
+            ]
+            self.sync(" AND ".join(lucene) if lucene else "*:*", start, end, scopes)
+
+        conditions += ["filedAt >= ?", "filedAt < ?"]
+        params += [start.isoformat(), _next_day(end)]
+        sql = (
+            "SELECT data FROM filings WHERE "
+            + " AND ".join(conditions)
+            + " ORDER BY filedAt "
+            + ("ASC" if order == "asc" else "DESC")
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        return [loads(row[0]) for row in self.execute(sql, params)]
+
+    def execute(self, sql, params=()):
+        """
+        Runs a SQL query against the store and returns all rows, e.g.
+        store.execute("SELECT formType, COUNT(*) FROM filings GROUP BY formType")
+        """
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
@@ -0,0 +1,229 @@
+"""
+Client for the real-time Stream API of newly published EDGAR filings.
+
+Requires websockets: pip install sec-api[stream]
+
+    import asyncio
+    from sec_api import StreamApi
+
+    async def main():
+        async with StreamApi("YOUR_API_KEY") as stream:
+            async for filing in stream:
+                print(filing["accessionNo"], filing["formType"], filing["filedAt"])
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import inspect
+from collections import OrderedDict
+
+from sec_api.decoding import loads
+from sec_api.transport import RetryPolicy
+
+stream_api_endpoint = "wss://stream.sec-api.io"
+
+
+def _import_websockets():
+    try:
+        import websockets
+    except ImportError:
+        raise ImportError(
+            "StreamApi requires websockets. Install it with: pip install websockets"
+        )
+    return websockets
+
+
+class _StreamClosed:
+    pass
+
+
+class StreamApi:
+    """
+    Real-time stream of new filings with automatic reconnects.
+
+    Received filings are put into a queue of max_queue_size filings. If
+    the consumer falls behind and the queue is full, the client stops
+    reading from the connection until there is space again, so memory
+    stays bounded.
+
+    The connection is checked with a ping every heartbeat_interval
+    seconds and is considered dead if no pong arrives within
+    heartbeat_timeout seconds. Dropped connections are reopened with
+    exponential backoff (retry_policy). After a reconnect, filings
+    published while disconnected are backfilled with the Query API
+    (query_api, default: AsyncQueryApi, requires aiohttp) before live
+    filings are delivered. Filings are deduplicated by accession number.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        query_api=None,
+        max_queue_size=1000,
+        heartbeat_interval=20,
+        heartbeat_timeout=20,
+        retry_policy=None,
+        backfill=True,
+        max_backfill=10000,
+    ):
+        self.api_key = api_key
+        self.api_endpoint = stream_api_endpoint + "?apiKey=" + api_key
+        self.query_api = query_api
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.retry_policy = (
+            retry_policy
+            if retry_policy
+            else RetryPolicy(backoff_factor=1, max_backoff=60)
+        )
+        self.backfill = backfill
+        self.max_backfill = max_backfill
+        self.max_queue_size = max_queue_size
+
+        self.last_filed_at = None
+        self._seen = OrderedDict()
+        self._queue = None
+        self._task = None
+        self._closed = False
+
+    def _is_new(self, filing):
+        accession_no = filing.get("accessionNo")
+        if accession_no in self._seen:
+            return False
+        self._seen[accession_no] = True
+        # only recent accession numbers can show up again
+        while len(self._seen) > 10000:
+            self._seen.popitem(last=False)
+
+        filed_at = filing.get("filedAt")
+        if filed_at and (self.last_filed_at is None or filed_at > self.last_filed_at):
+            self.last_filed_at = filed_at
+        return True
+
+    async def _put(self, filings):
+        for filing in filings:
+            if self._is_new(filing):
+                await self._queue.put(filing)
+
+    def _get_query_api(self):
+        if self.query_api is None:
+            from sec_api.aio import AsyncQueryApi
+
+            self.query_api = AsyncQueryApi(self.api_key)
+        return self.query_api
+
+    async def _get_filings(self, query):
+        query_api = self._get_query_api()
+        if inspect.iscoroutinefunction(query_api.get_filings):
+            return await query_api.get_filings(query)
+        return await asyncio.to_thread(query_api.get_filings, query)
+
+    async def _backfill(self):
+        """
+        Fetches all filings filed at or after the last received filing
+        """
+        query = {
+            "query": 'filedAt:["' + self.last_filed_at + '" TO *]',
+            "size": "50",
+            "sort": [{"filedAt": {"order": "asc"}}],
+        }
+        offset = 0
+        while offset < self.max_backfill:
+            query["from"] = str(offset)
+            filings = (await self._get_filings(query)).get("filings", [])
+            await self._put(filings)
+            if len(filings) < 50:
+                break
+            offset += 50
+
+    def _is_fatal(self, error):
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", getattr(error, "status_code", None))
+        return status in (401, 403)
+
+    async def _run(self):
+        websockets = _import_websockets()
+        retry = 0
+        connected_before = False
+
+        try:
+            while True:
+                try:
+                    async with websockets.connect(
+                        self.api_endpoint,
+                        ping_interval=self.heartbeat_interval,
+                        ping_timeout=self.heartbeat_timeout,
+                    ) as websocket:
+                        if connected_before and self.backfill and self.last_filed_at:
+                            await self._backfill()
+                        connected_before = True
+
+                        async for message in websocket:
+                            retry = 0
+                            await self._put(loads(message))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if self._is_fatal(e):
+                        raise
+                    # connection dropped, heartbeat timed out or backfill failed
+                    connected_before = True
+
+                await asyncio.sleep(self.retry_policy.get_backoff(retry))
+                retry += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._queue.put(e)
+
+    def start(self):
+        """
+        Connects to the stream in a background task. Called automatically
+        on the first iteration.
+        """
+        if self._task is None and not self._closed:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = asyncio.ensure_future(self._run())
+
+    async def get(self):
+        """
+        Returns the next filing, waiting until one is received
+        """
+        if self._closed and (self._queue is None or self._queue.empty()):
+            raise StopAsyncIteration
+        self.start()
+        item = await self._queue.get()
+        if isinstance(item, _StreamClosed):
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+    async def close(self):
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            # wake up consumers waiting for the next filing
+            try:
+                self._queue.put_nowait(_StreamClosed())
+            except asyncio.QueueFull:
+                pass
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
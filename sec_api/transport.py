@@ -0,0 +1,351 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing rate requests per second
+    with bursts of up to burst requests.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst else rate)
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self):
+        """
+        Takes one token and returns the number of seconds
+        to wait until the token is available.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# endpoint family -> URL fragment identifying the family.
+# all other requests belong to the "query" family.
+endpoint_families = [
+    ("archive", "archive.sec-api.io"),
+    ("extractor", "/extractor"),
+    ("xbrl", "/xbrl-to-json"),
+    ("pdf", "/filing-reader"),
+]
+
+# requests per second per endpoint family, None = no limit
+default_rate_limits = {
+    "query": None,
+    "archive": 40,
+    "extractor": None,
+    "xbrl": None,
+    "pdf": None,
+}
+
+
+def endpoint_family(url):
+    for family, fragment in endpoint_families:
+        if fragment in url:
+            return family
+    return "query"
+
+
+class RateLimiter:
+    """
+    Proactive rate limiter with one token bucket per endpoint family
+    (query, archive, extractor, xbrl, pdf). Safe to share across threads
+    and asyncio tasks, so all API instances of a process stay within
+    the allowed rate instead of running into "too many requests" errors.
+
+    rates: requests per second per family, e.g. {"query": 10, "archive": 40}.
+        Families without a rate are not limited.
+    """
+
+    def __init__(self, rates=None, burst=None):
+        self.buckets = {}
+        self.lock = threading.Lock()
+        rates = rates if rates is not None else default_rate_limits
+        for family, rate in rates.items():
+            self.set_rate(family, rate, burst)
+
+    def set_rate(self, family, rate, burst=None):
+        with self.lock:
+            if rate:
+                self.buckets[family] = TokenBucket(rate, burst)
+            else:
+                self.buckets.pop(family, None)
+
+    def acquire(self, url):
+        bucket = self.buckets.get(endpoint_family(url))
+        if bucket:
+            bucket.acquire()
+
+    async def acquire_async(self, url):
+        bucket = self.buckets.get(endpoint_family(url))
+        if bucket:
+            await bucket.acquire_async()
+
+
+_default_rate_limiter = RateLimiter()
+
+
+def get_default_rate_limiter():
+    """
+    Returns the process-wide rate limiter shared by all transports
+    that are created without an explicit rate limiter.
+    """
+    return _default_rate_limiter
+
+
+def set_rate_limits(**rates):
+    """
+    Sets the requests per second of endpoint families of the
+    process-wide rate limiter, e.g. set_rate_limits(query=10, archive=40)
+    """
+    for family, rate in rates.items():
+        _default_rate_limiter.set_rate(family, rate)
+
+
+class RetryPolicy:
+    """
+    Retry policy applied to every request of a transport.
+
+    Failed requests are retried with exponential backoff
+    (backoff_factor * 2 ** retry, capped at max_backoff) and full jitter,
+    so parallel workers don't retry in lockstep. A Retry-After header sent
+    with the response takes precedence over the computed backoff.
+
+    All sec-api.io endpoints are read-only, so connection errors and
+    timeouts are retried for GET and POST requests alike.
+
+    max_retries: max. number of retries after the first attempt
+    retry_statuses: HTTP status codes that are retried
+    retry_errors: retry connection errors and timeouts
+    deadline: max. number of seconds spent on a request including all
+        retries and backoff, None = no deadline
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        max_backoff=30,
+        jitter=True,
+        retry_statuses=(429, 500, 502, 503, 504),
+        retry_errors=True,
+        respect_retry_after=True,
+        deadline=None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_errors = retry_errors
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+
+    def get_backoff(self, retry, headers=None):
+        """
+        Returns the number of seconds to wait before the given retry
+        (0 = first retry).
+        """
+        if self.respect_retry_after and headers:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        # the exponent is capped, 2.0 ** 1024 overflows a float, e.g. after
+        # many reconnects of a stream that retries forever
+        backoff = min(self.backoff_factor * (2 ** min(retry, 32)), self.max_backoff)
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def next_backoff(self, retry, started_at, headers=None, max_retries=None):
+        """
+        Returns the backoff before the given retry, or None if the
+        retry budget or the deadline is exhausted.
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if retry >= max_retries:
+            return None
+
+        backoff = self.get_backoff(retry, headers)
+        if self.deadline is not None:
+            if time.monotonic() - started_at + backoff > self.deadline:
+                return None
+        return backoff
+
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header (seconds or HTTP date) into seconds
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+default_retry_policy = RetryPolicy()
+
+
+class Transport:
+    """
+    Shared HTTP transport with keep-alive connection pooling.
+
+    A single instance can be passed into every API class so that all
+    calls in a process reuse warm TCP/TLS connections to api.sec-api.io
+    and archive.sec-api.io instead of opening a new one per request.
+
+    pool_connections: number of per-host connection pools to keep
+    pool_maxsize: max. number of connections kept alive per host
+    host_pool_sizes: per-host override of pool_maxsize, e.g.
+        {"https://archive.sec-api.io": 40}
+    rate_limiter: RateLimiter applied to every request, defaults to
+        the process-wide rate limiter
+    retry_policy: RetryPolicy applied to every request
+    """
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        host_pool_sizes=None,
+        rate_limiter=None,
+        retry_policy=None,
+    ):
+        self.session = requests.Session()
+        self.rate_limiter = rate_limiter if rate_limiter else get_default_rate_limiter()
+        self.retry_policy = retry_policy if retry_policy else default_retry_policy
+
+        default_adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", default_adapter)
+        self.session.mount("http://", default_adapter)
+
+        host_pool_sizes = host_pool_sizes if host_pool_sizes else {}
+        for host, maxsize in host_pool_sizes.items():
+            self.session.mount(
+                host, HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+            )
+
+    def request(self, method, url, retry_statuses=(), max_retries=None, **kwargs):
+        """
+        Sends a request and retries it according to the retry policy.
+        Returns the last response, which may have a retryable status
+        code if all retries failed.
+
+        retry_statuses: additional status codes to retry, e.g. (202,)
+        max_retries: overrides max_retries of the retry policy
+        """
+        policy = self.retry_policy
+        retry_statuses = policy.retry_statuses + tuple(retry_statuses)
+        started_at = time.monotonic()
+        retry = 0
+
+        while True:
+            self.rate_limiter.acquire(url)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                backoff = None
+                if policy.retry_errors:
+                    backoff = policy.next_backoff(
+                        retry, started_at, max_retries=max_retries
+                    )
+                if backoff is None:
+                    raise
+            else:
+                if response.status_code not in retry_statuses:
+                    return response
+                backoff = policy.next_backoff(
+                    retry, started_at, response.headers, max_retries
+                )
+                if backoff is None:
+                    return response
+                response.close()
+
+            time.sleep(backoff)
+            retry += 1
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport():
+    """
+    Returns the process-wide transport used by all API classes
+    that are created without an explicit transport.
+    """
+    global _default_transport
+
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+
+    return _default_transport
+
+
+def set_default_transport(transport):
+    """
+    Replaces the process-wide transport, e.g. to increase pool sizes
+    for all API classes at once.
+    """
+    global _default_transport
+
+    with _default_transport_lock:
+        _default_transport = transport
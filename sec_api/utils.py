@@ -0,0 +1,105 @@
+import codecs
+import json
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def iter_completed(fn, items, max_workers=8, max_pending=None):
+    """
+    Runs fn(item) for every item on a thread pool and yields
+    (item, result, error) tuples in completion order.
+
+    At most max_pending calls (default: 2 * max_workers) are scheduled at
+    a time, so items can be a lazy iterable of any length. Exceptions
+    raised by fn are returned as error instead of aborting the batch.
+    """
+    max_pending = max_pending if max_pending else 2 * max_workers
+    items = iter(items)
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            for item in items:
+                pending[executor.submit(fn, item)] = item
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                result = future.result() if error is None else None
+                yield item, result, error
+
+
+_json_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+
+
+def iter_json_array(chunks, key=None):
+    """
+    Incrementally decodes a JSON array from an iterable of byte chunks and
+    yields its items one at a time, e.g. from response.iter_content().
+    Only the current item is held in memory.
+
+    key: name of the object key holding the array, e.g.
+        "proxyVotingRecords" for {"proxyVotingRecords": [...]}.
+        If None, the document itself must be an array.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    finished = False
+
+    def read():
+        nonlocal buffer, pos, finished
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            buffer = buffer[pos:] + decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + decoder.decode(chunk)
+        pos = 0
+
+    # find the start of the array
+    pattern = re.compile(
+        ('"' + re.escape(key) + r'"\s*:\s*\[') if key is not None else r"\s*\["
+    )
+    while True:
+        match = pattern.search(buffer, pos)
+        if match:
+            pos = match.end()
+            break
+        if finished:
+            return
+        # keep the tail in case the key is split across chunks
+        if key is not None:
+            pos = max(pos, len(buffer) - len(key) - 64)
+        read()
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _whitespace + ",":
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+        try:
+            item, end = _json_decoder.raw_decode(buffer, pos)
+            # objects, arrays and strings end with a delimiter, a number
+            # may continue in the next chunk (e.g. "35000000000." then
+            # "0"), so it is complete only once a delimiter follows
+            if (
+                buffer[pos] in '{["'
+                or (end < len(buffer) and buffer[end] in _whitespace + ",]")
+                or finished
+            ):
+                pos = end
+                yield item
+                continue
+        except json.JSONDecodeError:
+            if finished:
+                raise
+        read()
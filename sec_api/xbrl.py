@@ -0,0 +1,243 @@
+from array import array
+
+columns = [
+    "statement",
+    "concept",
+    "startDate",
+    "endDate",
+    "instant",
+    "segment",
+    "unit",
+    "decimals",
+    "value",
+]
+
+_string_columns = columns[:-1]
+_date_columns = ["startDate", "endDate", "instant"]
+
+
+def _segment(segment):
+    if not segment:
+        return None
+    if isinstance(segment, dict):
+        segment = [segment]
+    return ";".join(
+        str(s.get("dimension", "")) + "=" + str(s.get("value", "")) for s in segment
+    )
+
+
+def _new_columns(sources):
+    data = {name: [] for name in _string_columns}
+    data["value"] = array("d")
+    if sources:
+        data["source"] = []
+    return data
+
+
+def _flatten_into(data, xbrl_json, statements=None, source=None):
+    append = {name: data[name].append for name in _string_columns}
+    values = data["value"]
+    count = 0
+
+    for statement, items in xbrl_json.items():
+        if statements is not None and statement not in statements:
+            continue
+        if not isinstance(items, dict):
+            continue
+        for concept, facts in items.items():
+            # the cover page holds single facts and plain strings
+            if isinstance(facts, dict):
+                facts = [facts]
+            elif not isinstance(facts, list):
+                continue
+            for fact in facts:
+                if not isinstance(fact, dict):
+                    continue
+                # skip text blocks and other non-numeric facts
+                try:
+                    value = float(fact.get("value"))
+                except (TypeError, ValueError):
+                    continue
+                period = fact.get("period") or {}
+                append["statement"](statement)
+                append["concept"](concept)
+                append["startDate"](period.get("startDate"))
+                append["endDate"](period.get("endDate"))
+                append["instant"](period.get("instant"))
+                append["segment"](_segment(fact.get("segment")))
+                append["unit"](fact.get("unitRef"))
+                append["decimals"](fact.get("decimals"))
+                values.append(value)
+                count += 1
+
+    if "source" in data:
+        data["source"].extend([source] * count)
+    return count
+
+
+def flatten_xbrl(xbrl_jsons, statements=None, sources=None):
+    """
+    Flattens one or many XbrlApi.xbrl_to_json() results into long-format
+    columns: a dict of lists per column name plus an array of float64
+    values. Each numeric fact becomes one row with its statement, concept,
+    period (startDate/endDate or instant), segment ("dimension=member",
+    joined by ";"), unit and decimals. Non-numeric facts are skipped.
+
+    statements limits the output to the given statements, e.g.
+    ["StatementsOfIncome", "BalanceSheets"]. sources labels the rows of
+    each payload, e.g. with accession numbers, in an extra source column.
+    """
+    if isinstance(xbrl_jsons, dict):
+        xbrl_jsons = [xbrl_jsons]
+        sources = [sources] if sources is not None else None
+    if statements is not None:
+        statements = set(statements)
+
+    data = _new_columns(sources is not None)
+    sources = iter(sources) if sources is not None else None
+    for xbrl_json in xbrl_jsons:
+        source = next(sources) if sources is not None else None
+        _flatten_into(data, xbrl_json, statements, source)
+    return data
+
+
+def _to_arrow(data):
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow conversion requires pyarrow. Install it with: pip install pyarrow"
+        )
+
+    arrays = {}
+    for name in data:
+        if name == "value":
+            values = data["value"]
+            # zero-copy view of the float64 array
+            arrays[name] = pyarrow.Array.from_buffers(
+                pyarrow.float64(), len(values), [None, pyarrow.py_buffer(values)]
+            )
+        elif name in _date_columns:
+            arrays[name] = pyarrow.array(data[name], pyarrow.string()).cast(
+                pyarrow.date32()
+            )
+        else:
+            arrays[name] = pyarrow.array(data[name]).dictionary_encode()
+    return pyarrow.table(arrays)
+
+
+def _to_pandas(data):
+    try:
+        import numpy
+        import pandas
+    except ImportError:
+        raise ImportError(
+            "DataFrame conversion requires pandas. Install it with: pip install pandas"
+        )
+
+    frame = {}
+    for name in data:
+        if name == "value":
+            frame[name] = numpy.frombuffer(data["value"], dtype=numpy.float64)
+        elif name in _date_columns:
+            frame[name] = pandas.to_datetime(data[name], format="%Y-%m-%d").astype(
+                "datetime64[ns]"
+            )
+        else:
+            frame[name] = pandas.Categorical(data[name])
+    return pandas.DataFrame(frame)
+
+
+def xbrl_to_arrow(xbrl_jsons, statements=None, sources=None):
+    """
+    Converts one or many XbrlApi.xbrl_to_json() results into a long-format
+    pyarrow Table, see flatten_xbrl(). Dates are date32, string columns
+    are dictionary encoded and values are float64.
+    """
+    return _to_arrow(flatten_xbrl(xbrl_jsons, statements, sources))
+
+
+def xbrl_to_pandas(xbrl_jsons, statements=None, sources=None):
+    """
+    Converts one or many XbrlApi.xbrl_to_json() results into a long-format
+    pandas DataFrame, see flatten_xbrl(). Dates are datetime64, string
+    columns are categoricals and values are float64.
+    """
+    return _to_pandas(flatten_xbrl(xbrl_jsons, statements, sources))
+
+
+class XbrlPanel:
+    """
+    Deduplicated company x concept x period table of numeric XBRL facts,
+    merged incrementally from XbrlApi.xbrl_to_json() results.
+
+    A fact is identified by cik, concept, period, segment and unit. If
+    several filings report the same fact, e.g. the prior year column of a
+    10-K, the value of the most recently filed filing wins, so restated
+    values replace the original ones.
+    """
+
+    def __init__(self, statements=None):
+        self.statements = set(statements) if statements is not None else None
+        self.accession_numbers = set()
+        self._facts = {}
+
+    def __len__(self):
+        return len(self._facts)
+
+    def add(self, xbrl_json, cik=None, accession_no=None, filed_at=None):
+        """
+        Merges the numeric facts of one XBRL-JSON result into the panel.
+        cik defaults to the EntityCentralIndexKey of the cover page.
+        """
+        if cik is None:
+            cik = (xbrl_json.get("CoverPage") or {}).get("EntityCentralIndexKey")
+        cik = str(cik).lstrip("0") if cik is not None else None
+        if accession_no is not None:
+            self.accession_numbers.add(accession_no)
+        rank = (filed_at or "", accession_no or "")
+
+        data = _new_columns(False)
+        _flatten_into(data, xbrl_json, self.statements)
+
+        facts = self._facts
+        rows = zip(*(data[name] for name in columns))
+        for statement, concept, start, end, instant, segment, unit, dec, value in rows:
+            key = (cik, concept, start, end, instant, segment, unit)
+            current = facts.get(key)
+            if current is not None and current[0] > rank:
+                continue
+            facts[key] = (rank, statement, dec, value)
+
+    def to_columns(self):
+        """
+        Returns the panel as a dict of lists per column name, see
+        flatten_xbrl(), plus cik, accessionNo and filedAt columns
+        """
+        data = _new_columns(False)
+        data["cik"] = []
+        data["accessionNo"] = []
+        data["filedAt"] = []
+        for key, (rank, statement, dec, value) in sorted(
+            self._facts.items(), key=lambda item: tuple(v or "" for v in item[0])
+        ):
+            cik, concept, start, end, instant, segment, unit = key
+            data["cik"].append(cik)
+            data["accessionNo"].append(rank[1] or None)
+            data["filedAt"].append(rank[0] or None)
+            data["statement"].append(statement)
+            data["concept"].append(concept)
+            data["startDate"].append(start)
+            data["endDate"].append(end)
+            data["instant"].append(instant)
+            data["segment"].append(segment)
+            data["unit"].append(unit)
+            data["decimals"].append(dec)
+            data["value"].append(value)
+        return data
+
+    def to_arrow(self):
+        return _to_arrow(self.to_columns())
+
+    def to_pandas(self):
+        return _to_pandas(self.to_columns())
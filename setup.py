@@ -15,6 +15,14 @@ setup(
     install_requires=[
         "requests",
     ],
+    extras_require={
+        "aio": ["aiohttp"],
+        "parquet": ["pyarrow"],
+        "pandas": ["pandas"],
+        "fast": ["orjson"],
+        "stream": ["websockets", "aiohttp"],
+        "numpy": ["numpy"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
@@ -0,0 +1,167 @@
+import json
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from sec_api.bulk import BulkExporter, WindowExceededError
+
+range_pattern = re.compile(r'filedAt:\["([^"]+)" TO "([^"]+)"\}')
+
+
+class FakeApi:
+    """
+    Serves records from memory, applying the filedAt range filter and the
+    from/size pagination of a search API
+    """
+
+    def __init__(self, records, fail_after=None):
+        self.records = sorted(records, key=lambda r: _parse(r["filedAt"]))
+        self.queries = []
+        self.fail_after = fail_after
+
+    def get_data(self, query):
+        if self.fail_after is not None and len(self.queries) >= self.fail_after:
+            raise ConnectionError("connection dropped")
+        self.queries.append(query)
+        records = self.records
+        match = range_pattern.search(query["query"])
+        if match:
+            lower, upper = (datetime.fromisoformat(v) for v in match.groups())
+            records = [r for r in records if lower <= _parse(r["filedAt"]) < upper]
+        offset = int(query["from"])
+        return {
+            "total": {"value": len(records), "relation": "eq"},
+            "data": records[offset : offset + int(query["size"])],
+        }
+
+
+def _parse(value):
+    return datetime.fromisoformat(value)
+
+
+def _records(n, start="2024-01-01T09:00:00-05:00", step=timedelta(hours=1)):
+    first = _parse(start)
+    return [
+        {"accessionNo": "a%05d" % i, "filedAt": (first + i * step).isoformat()}
+        for i in range(n)
+    ]
+
+
+def _ids(records):
+    return [record["accessionNo"] for record in records]
+
+
+def test_shard_bounds_are_quoted_with_offset():
+    api = FakeApi([])
+    exporter = BulkExporter(api, max_workers=1)
+    list(exporter.iter_records({"query": "*:*"}, "2024-01-01", "2024-01-01"))
+
+    assert (
+        'filedAt:["2024-01-01T05:00:00+00:00" TO "2024-01-02T05:00:00+00:00"}'
+        in api.queries[0]["query"]
+    )
+
+
+def test_dates_are_eastern_time():
+    # 20:00 Eastern is already the next day in UTC
+    late = {"accessionNo": "late", "filedAt": "2024-01-31T20:00:00-05:00"}
+    exporter = BulkExporter(FakeApi([late]), max_workers=1)
+
+    assert _ids(exporter.iter_records({}, "2024-01-31", "2024-01-31")) == ["late"]
+    assert _ids(exporter.iter_records({}, "2024-02-01", "2024-02-01")) == []
+
+
+def test_large_shards_are_split():
+    records = _records(500)
+    api = FakeApi(records)
+    exporter = BulkExporter(api, page_size=10, max_window=100, max_workers=2)
+
+    result = list(exporter.iter_records({}, "2024-01-01", "2024-02-28"))
+
+    assert _ids(result) == _ids(records)
+
+
+def test_unsplittable_shard_raises():
+    records = _records(150, step=timedelta(0))
+    exporter = BulkExporter(FakeApi(records), page_size=10, max_window=100)
+
+    with pytest.raises(WindowExceededError):
+        list(exporter.iter_records({}, "2024-01-01", "2024-01-31"))
+
+
+def test_export_resumes_after_interruption(tmp_path):
+    records = _records(300, step=timedelta(hours=5))
+    path = str(tmp_path / "out.jsonl")
+    checkpoint_path = str(tmp_path / "out.checkpoint")
+
+    api = FakeApi(records, fail_after=12)
+    exporter = BulkExporter(
+        api, page_size=10, max_workers=1, shard_days=10, checkpoint_path=checkpoint_path
+    )
+    with pytest.raises(ConnectionError):
+        exporter.export({}, path, "2024-01-01", "2024-03-31")
+
+    api.fail_after = None
+    count = exporter.export({}, path, "2024-01-01", "2024-03-31")
+
+    with open(path) as f:
+        exported = [json.loads(line) for line in f]
+    assert count == len(records)
+    assert _ids(exported) == _ids(records)
+
+
+def test_export_refuses_to_overwrite_without_checkpoint(tmp_path):
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"accessionNo": "existing"}\n' * 3000)
+    exporter = BulkExporter(FakeApi(_records(5)), max_workers=1)
+
+    with pytest.raises(FileExistsError):
+        exporter.export({}, str(path), "2024-01-01", "2024-01-31")
+    assert len(path.read_text().splitlines()) == 3000
+
+    assert (
+        exporter.export({}, str(path), "2024-01-01", "2024-01-31", overwrite=True) == 5
+    )
+    assert len(path.read_text().splitlines()) == 5
+
+
+def test_checkpoint_of_other_export_is_rejected(tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    checkpoint_path = str(tmp_path / "out.checkpoint")
+    exporter = BulkExporter(
+        FakeApi(_records(5)), max_workers=1, checkpoint_path=checkpoint_path
+    )
+    exporter.export({"query": "formType:4"}, path, "2024-01-01", "2024-01-31")
+
+    with pytest.raises(ValueError):
+        exporter.export({"query": "formType:3"}, path, "2024-01-01", "2024-01-31")
+    with pytest.raises(ValueError):
+        exporter.export({"query": "formType:4"}, path, "2024-01-01", "2024-02-29")
+
+
+def test_parquet_export_writes_row_groups_per_page(tmp_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    records = _records(25)
+    # a column missing on later pages and one that changes its type
+    records[0]["extra"] = "x"
+    records[20]["ticker"] = 5
+    for record in records[:20]:
+        record["ticker"] = "AAA"
+    path = tmp_path / "out"
+    exporter = BulkExporter(FakeApi(records), page_size=10, max_workers=1)
+
+    assert (
+        exporter.export({}, str(path), "2024-01-01", "2024-01-31", format="parquet")
+        == 25
+    )
+
+    files = sorted(path.iterdir())
+    assert [pyarrow_parquet.ParquetFile(f).metadata.num_row_groups for f in files] == [
+        2,
+        1,
+    ]
+    rows = [row for f in files for row in pyarrow_parquet.read_table(f).to_pylist()]
+    assert _ids(rows) == _ids(records)
+    assert rows[0]["extra"] == "x" and rows[1]["extra"] is None
+    assert rows[20]["ticker"] == 5
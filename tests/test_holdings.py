@@ -0,0 +1,123 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from sec_api.holdings import HoldingsStore  # noqa: E402
+from sec_api.models import holdings_13f  # noqa: E402
+
+
+def _holding(cusip, shares, value, putCall=None):
+    holding = {
+        "nameOfIssuer": "Issuer " + cusip,
+        "cusip": cusip,
+        "value": value,
+        "shrsOrPrnAmt": {"sshPrnamt": shares, "sshPrnamtType": "SH"},
+    }
+    if putCall:
+        holding["putCall"] = putCall
+    return holding
+
+
+def _filing(accession_no, cik, period, holdings):
+    return {
+        "accessionNo": accession_no,
+        "cik": cik,
+        "periodOfReport": period,
+        "holdings": holdings,
+    }
+
+
+@pytest.fixture
+def store():
+    store = HoldingsStore()
+    store.add(
+        {
+            "data": [
+                _filing("a1", "1", "2023-12-31", [_holding("AAA", 10, 100)]),
+                _filing(
+                    "a2",
+                    "1",
+                    "2024-03-31",
+                    [
+                        _holding("AAA", 15, 150),
+                        # a second line of the same security is summed up
+                        _holding("AAA", 5, 50),
+                        _holding("BBB", 20, 400),
+                        _holding("CCC", 1, 10, putCall="Call"),
+                    ],
+                ),
+                _filing("b1", "2", "2023-12-31", [_holding("BBB", 30, 600)]),
+                _filing("b2", "2", "2024-03-31", [_holding("AAA", 50, 500)]),
+            ]
+        }
+    )
+    return store
+
+
+def test_filings_are_deduplicated(store):
+    size = len(store)
+    filing = _filing("a1", "1", "2023-12-31", [_holding("AAA", 10, 100)])
+    assert store.add([filing]) == 0
+    new = _filing("c1", "3", "2024-03-31", [_holding("AAA", 1, 10)])
+    assert store.add([new, new]) == 1
+    assert len(store) == size + 1
+
+
+def test_interleaved_records_are_added():
+    first = list(
+        holdings_13f([_filing("a", "1", "2024-03-31", [_holding("AAA", 1, 1)] * 2)])
+    )
+    second = list(
+        holdings_13f([_filing("b", "2", "2024-03-31", [_holding("B", 1, 1)])])
+    )
+    store = HoldingsStore()
+    assert store.add([first[0], second[0], first[1]]) == 3
+    assert store.add(first) == 0
+
+
+def test_arrays(store):
+    columns = store.arrays()
+    assert columns["period"].dtype == numpy.dtype("datetime64[D]")
+    assert columns["cik"].dtype == numpy.int64
+    assert store.periods == ["2023-12-31", "2024-03-31"]
+
+
+def test_changes(store):
+    changes = store.changes("2024-03-31", "2023-12-31")
+    rows = {
+        (int(cik), cusip): (status, change)
+        for cik, cusip, status, change in zip(
+            changes["cik"],
+            changes["cusip"],
+            changes["status"],
+            changes["shares_change"],
+        )
+    }
+    assert rows == {
+        (1, "AAA"): ("increased", 10),
+        (1, "BBB"): ("new", 20),
+        (2, "AAA"): ("new", 50),
+        (2, "BBB"): ("closed", -30),
+    }
+
+
+def test_options_are_excluded_unless_requested(store):
+    assert "CCC" not in list(store.positions("2024-03-31")["cusip"])
+    store.include_options = True
+    assert "CCC" in list(store.positions("2024-03-31")["cusip"])
+
+
+def test_by_cusip_and_top_holders(store):
+    totals = store.by_cusip("2024-03-31")
+    assert list(totals["cusip"]) == ["AAA", "BBB"]
+    assert list(totals["holders"]) == [2, 1]
+    assert list(totals["value"]) == [700, 400]
+
+    holders = store.top_holders("AAA", "2024-03-31", n=1)
+    assert list(holders["cik"]) == [2]
+    assert list(holders["shares"]) == [50]
+
+
+def test_overlap(store):
+    overlap = store.overlap([1, 2, 3], "2024-03-31")
+    assert overlap.tolist() == [[2, 1, 0], [1, 1, 0], [0, 0, 0]]
@@ -0,0 +1,117 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from sec_api.insider import InsiderTransactionStore  # noqa: E402
+from sec_api.models import insider_transactions  # noqa: E402
+
+
+def _transaction(code, shares, price, acquired_disposed, day):
+    return {
+        "transactionDate": day,
+        "coding": {"code": code},
+        "amounts": {
+            "shares": shares,
+            "pricePerShare": price,
+            "acquiredDisposedCode": acquired_disposed,
+        },
+    }
+
+
+def _filing(accession_no, issuer, owner, transactions, derivative=()):
+    return {
+        "accessionNo": accession_no,
+        "periodOfReport": "2024-01-31",
+        "issuer": {"cik": "000" + issuer, "name": "Issuer " + issuer},
+        "reportingOwner": {"cik": owner, "name": "Owner " + owner},
+        "nonDerivativeTable": {"transactions": list(transactions)},
+        "derivativeTable": {"transactions": list(derivative)},
+    }
+
+
+@pytest.fixture
+def store():
+    store = InsiderTransactionStore()
+    store.add(
+        {
+            "transactions": [
+                _filing(
+                    "a1",
+                    "1",
+                    "10",
+                    [
+                        _transaction("P", 100, 10.0, "A", "2024-01-02"),
+                        _transaction("S", 30, 12.0, "D", "2024-01-20"),
+                    ],
+                    derivative=[_transaction("M", 5, 1.0, "A", "2024-01-02")],
+                ),
+                _filing(
+                    "a2", "1", "11", [_transaction("P", 10, 11.0, "A", "2024-02-15")]
+                ),
+                _filing(
+                    "b1", "2", "10", [_transaction("S", 50, 20.0, "D", "2024-01-05")]
+                ),
+            ]
+        }
+    )
+    return store
+
+
+def test_filings_are_deduplicated(store):
+    size = len(store)
+    filing = _filing("c1", "3", "12", [_transaction("P", 1, 1.0, "A", "2024-03-01")])
+    assert store.add([filing, filing]) == 1
+    assert store.add([filing]) == 0
+    assert store.add(list(insider_transactions([filing]))) == 0
+    assert len(store) == size + 1
+
+
+def test_arrays(store):
+    columns = store.arrays()
+    assert columns["date"].dtype == numpy.dtype("datetime64[D]")
+    assert list(columns["shares"]) == [100, -30, 5, 10, -50]
+
+
+def test_net_by_issuer(store):
+    net = store.net_by_issuer()
+    assert list(net["issuerCik"]) == ["1", "2"]
+    assert list(net["net_shares"]) == [80, -50]
+    assert list(net["net_value"]) == [100 * 10.0 - 30 * 12.0 + 10 * 11.0, -1000]
+    assert list(net["purchases"]) == [2, 0]
+    assert list(net["sales"]) == [1, 1]
+    assert list(net["insiders"]) == [2, 1]
+
+
+def test_net_by_issuer_filters(store):
+    net = store.net_by_issuer(start="2024-02-01", codes=("P",))
+    assert list(net["issuerCik"]) == ["1"]
+    assert list(net["net_shares"]) == [10]
+
+    net = store.net_by_issuer(codes=None, include_derivative=True)
+    assert list(net["net_shares"]) == [85, -50]
+
+
+def test_net_by_insider(store):
+    net = store.net_by_insider()
+    rows = {
+        (owner, issuer): shares
+        for owner, issuer, shares in zip(
+            net["ownerCik"], net["issuerCik"], net["net_shares"]
+        )
+    }
+    assert rows == {("10", "1"): 70, ("11", "1"): 10, ("10", "2"): -50}
+
+
+def test_net_by_window(store):
+    net = store.net_by_window(days=30, start="2024-01-01")
+    rows = {
+        (str(window), issuer): shares
+        for window, issuer, shares in zip(
+            net["window"], net["issuerCik"], net["net_shares"]
+        )
+    }
+    assert rows == {
+        ("2024-01-01", "1"): 70,
+        ("2024-01-01", "2"): -50,
+        ("2024-01-31", "1"): 10,
+    }
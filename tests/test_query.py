@@ -0,0 +1,74 @@
+import re
+
+import pytest
+
+from sec_api import QueryApi
+from sec_api.bulk import WindowExceededError
+
+upper_pattern = re.compile(r'filedAt:\[\* TO "([^"]+)"\]')
+
+
+class FakeQueryApi(QueryApi):
+    """
+    Serves filings from memory, newest first, applying the filedAt upper
+    bound and the result window of the Query API
+    """
+
+    def __init__(self, filings, max_window):
+        super().__init__("key")
+        self.filings = sorted(filings, key=lambda f: f["filedAt"], reverse=True)
+        self.max_window = max_window
+        self.queries = []
+
+    def get_filings(self, query):
+        self.queries.append(query)
+        offset, size = int(query["from"]), int(query["size"])
+        if offset + size > self.max_window:
+            raise Exception("API error: 400 - result window exceeded")
+        filings = self.filings
+        match = upper_pattern.search(query.get("query", ""))
+        if match:
+            filings = [f for f in filings if f["filedAt"] <= match.group(1)]
+        return {"filings": filings[offset : offset + size]}
+
+
+def _filings(timestamps):
+    return [
+        {"accessionNo": "%05d" % i, "filedAt": "2024-01-01T%s-05:00" % timestamp}
+        for i, timestamp in enumerate(timestamps)
+    ]
+
+
+def test_single_page():
+    api = FakeQueryApi(_filings(["10:00:00", "11:00:00"]), max_window=100)
+    filings = list(api.iter_filings({"query": "formType:8-K", "size": "10"}))
+    assert [f["accessionNo"] for f in filings] == ["00001", "00000"]
+    assert len(api.queries) == 1
+
+
+def test_pages_past_the_result_window():
+    # groups of 3 filings share a timestamp, so window boundaries fall
+    # inside groups
+    timestamps = ["%02d:%02d:00" % divmod(i // 3, 60) for i in range(230)]
+    filings = _filings(timestamps)
+    api = FakeQueryApi(filings, max_window=50)
+
+    result = list(api.iter_filings({"query": "*:*", "size": "10"}, max_window=50))
+
+    assert sorted(f["accessionNo"] for f in result) == sorted(
+        f["accessionNo"] for f in filings
+    )
+    assert len(result) == len(filings)
+    filed_at = [f["filedAt"] for f in result]
+    assert filed_at == sorted(filed_at, reverse=True)
+    assert any("filedAt:[* TO" in q["query"] for q in api.queries)
+
+
+def test_crowded_timestamp_raises():
+    api = FakeQueryApi(_filings(["10:00:00"] * 60), max_window=50)
+    result = []
+    with pytest.raises(WindowExceededError):
+        for filing in api.iter_filings({"size": "10"}, max_window=50):
+            result.append(filing)
+    # every filing before the error is yielded once
+    assert len(result) == len({f["accessionNo"] for f in result}) == 50
@@ -0,0 +1,114 @@
+import re
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from sec_api.store import FilingStore
+
+range_pattern = re.compile(r'filedAt:\["([^"]+)" TO "([^"]+)"\}')
+term_pattern = re.compile(r'(\w+):"([^"]*)"')
+
+
+class FakeQueryApi:
+    """
+    Serves filings from memory, applying field:"value" terms, the filedAt
+    range filter and from/size pagination
+    """
+
+    def __init__(self, filings):
+        self.filings = filings
+        self.queries = []
+
+    def get_filings(self, query):
+        self.queries.append(query["query"])
+        lower, upper = (
+            datetime.fromisoformat(value)
+            for value in range_pattern.search(query["query"]).groups()
+        )
+        terms = term_pattern.findall(query["query"])
+        filings = [
+            f
+            for f in self.filings
+            if lower <= datetime.fromisoformat(f["filedAt"]) < upper
+            and all(str(f.get(field)) == value for field, value in terms)
+        ]
+        offset = int(query["from"])
+        return {
+            "total": {"value": len(filings), "relation": "eq"},
+            "filings": filings[offset : offset + int(query["size"])],
+        }
+
+
+def _filing(accession_no, ticker, form_type, day):
+    return {
+        "accessionNo": accession_no,
+        "cik": "000032019" if ticker == "AAPL" else "789019",
+        "ticker": ticker,
+        "formType": form_type,
+        "filedAt": day + "T16:30:00-05:00",
+        "companyName": ticker,
+    }
+
+
+@pytest.fixture
+def filings():
+    return [
+        _filing("1", "AAPL", "10-K", "2023-11-03"),
+        _filing("2", "AAPL", "10-Q", "2023-08-04"),
+        _filing("3", "MSFT", "10-K", "2023-07-27"),
+        _filing("4", "AAPL", "10-K", "2022-10-28"),
+    ]
+
+
+def test_find_answers_covered_ranges_offline(tmp_path, filings):
+    api = FakeQueryApi(filings)
+    with FilingStore(str(tmp_path / "filings.db"), api) as store:
+        assert store.sync('formType:"10-K"', "2023-01-01", "2023-12-31") == 2
+        requests = len(api.queries)
+
+        result = store.find(
+            ticker="AAPL", form_type="10-K", start="2023-01-01", end="2023-12-31"
+        )
+        assert [f["accessionNo"] for f in result] == ["1"]
+        # covered by the sync of formType:"10-K"
+        assert len(api.queries) == requests
+
+        # only 2022 is fetched
+        result = store.find(
+            ticker="AAPL", form_type="10-K", start="2022-01-01", end="2023-12-31"
+        )
+        assert [f["accessionNo"] for f in result] == ["1", "4"]
+        lower_bounds = [
+            range_pattern.search(q).group(1) for q in api.queries[requests:]
+        ]
+        assert lower_bounds and all(b.startswith("2022-") for b in lower_bounds)
+
+
+def test_sync_merges_and_skips_covered_ranges(tmp_path, filings):
+    api = FakeQueryApi(filings)
+    with FilingStore(str(tmp_path / "filings.db"), api) as store:
+        store.sync("*:*", "2023-01-01", "2023-06-30")
+        store.sync("*:*", "2023-07-01", "2023-12-31")
+        assert store.missing_ranges("*:*", "2023-01-01", "2023-12-31") == []
+        assert store.missing_ranges('ticker:"AAPL"', "2022-12-01", "2023-02-01") == [
+            ("2022-12-01", "2022-12-31")
+        ]
+        requests = len(api.queries)
+        assert store.sync("*:*", "2023-03-01", "2023-09-30") == 0
+        assert len(api.queries) == requests
+
+
+def test_current_day_is_not_covered(tmp_path):
+    today = date.today()
+    api = FakeQueryApi([_filing("1", "AAPL", "8-K", today.isoformat())])
+    with FilingStore(str(tmp_path / "filings.db"), api) as store:
+        store.sync("*:*", today - timedelta(days=3), today)
+        assert store.missing_ranges("*:*", today - timedelta(days=3), today) == [
+            (today.isoformat(), today.isoformat())
+        ]
+
+
+def test_sync_requires_query_api(tmp_path):
+    with FilingStore(str(tmp_path / "filings.db")) as store:
+        with pytest.raises(ValueError):
+            store.sync("*:*", "2023-01-01", "2023-01-31")
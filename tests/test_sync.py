@@ -0,0 +1,110 @@
+import json
+import re
+from datetime import date, datetime, timedelta
+
+from sec_api.sync import IncrementalSync, SyncState
+
+range_pattern = re.compile(r'filedAt:\["([^"]+)" TO "([^"]+)"\}')
+today = date.today()
+
+
+class FakeApi:
+    """
+    Serves records from memory, applying the filedAt range filter and the
+    from/size pagination of a search API
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+
+    def get_data(self, query):
+        self.queries.append(query)
+        lower, upper = (
+            datetime.fromisoformat(value)
+            for value in range_pattern.search(query["query"]).groups()
+        )
+        records = sorted(
+            (
+                r
+                for r in self.records
+                if lower <= datetime.fromisoformat(r["filedAt"]) < upper
+            ),
+            key=lambda r: r["filedAt"],
+        )
+        offset = int(query["from"])
+        return {
+            "total": {"value": len(records), "relation": "eq"},
+            "data": records[offset : offset + int(query["size"])],
+        }
+
+
+def _record(accession_no, days_ago, time="10:00:00"):
+    day = today - timedelta(days=days_ago)
+    return {"accessionNo": accession_no, "filedAt": "%sT%s-04:00" % (day, time)}
+
+
+def _sync(api, path, **kwargs):
+    return IncrementalSync(api, SyncState(str(path)), **kwargs)
+
+
+def _ids(records):
+    return [r["accessionNo"] for r in records]
+
+
+def test_later_runs_return_new_records_only(tmp_path):
+    path = tmp_path / "state.json"
+    api = FakeApi([_record("a%d" % i, 10 - i) for i in range(10)])
+    start = (today - timedelta(days=30)).isoformat()
+
+    assert _ids(_sync(api, path).sync({"query": "x"}, start=start)) == [
+        "a%d" % i for i in range(10)
+    ]
+    assert _ids(_sync(api, path).sync({"query": "x"})) == []
+
+    # a filing indexed late, inside the lookback window, is picked up
+    api.records += [_record("new", 0, "12:00:00"), _record("late", 1, "01:00:00")]
+    assert sorted(_ids(_sync(api, path).sync({"query": "x"}))) == ["late", "new"]
+
+
+def test_state_is_saved_after_all_records_are_consumed(tmp_path):
+    path = tmp_path / "state.json"
+    api = FakeApi([_record("a%d" % i, 5) for i in range(3)])
+    start = (today - timedelta(days=10)).isoformat()
+
+    records = _sync(api, path).sync({"query": "x"}, start=start)
+    next(records)
+    records.close()
+    assert len(list(_sync(api, path).sync({"query": "x"}, start=start))) == 3
+
+
+def test_state_is_keyed_by_the_whole_query(tmp_path):
+    path = tmp_path / "state.json"
+    api = FakeApi([_record("a", 1)])
+    start = (today - timedelta(days=5)).isoformat()
+
+    assert _ids(_sync(api, path).sync({"query": "x"}, start=start)) == ["a"]
+    # paging parameters share the state, other fields don't
+    assert _ids(_sync(api, path).sync({"query": "x", "size": "10"})) == []
+    assert _ids(_sync(api, path).sync({"query": "x", "filter": "y"}, start=start)) == [
+        "a"
+    ]
+
+
+def test_empty_runs_move_the_window_forward(tmp_path):
+    path = tmp_path / "state.json"
+    stale = (today - timedelta(days=70)).isoformat()
+    name = 'FakeApi:{"query": "x"}'
+    # a state written before syncedUntil existed
+    path.write_text(json.dumps({name: {"highWaterMark": stale, "seen": {}}}))
+
+    api = FakeApi([])
+    list(_sync(api, path).sync({"query": "x"}))
+    state = json.loads(path.read_text())[name]
+    assert state["syncedUntil"] == today.isoformat()
+
+    # the next run starts at the last run minus lookback_days
+    api.queries.clear()
+    list(_sync(api, path).sync({"query": "x"}))
+    lower = range_pattern.search(api.queries[0]["query"]).group(1)
+    assert lower[:10] == (today - timedelta(days=1)).isoformat()
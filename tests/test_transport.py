@@ -0,0 +1,28 @@
+from sec_api.transport import RetryPolicy
+
+
+def test_backoff_is_capped_at_max_backoff():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=30, jitter=False)
+    assert [policy.get_backoff(retry) for retry in range(8)] == [
+        0.5,
+        1,
+        2,
+        4,
+        8,
+        16,
+        30,
+        30,
+    ]
+
+
+def test_backoff_after_many_retries():
+    # a stream reconnecting forever must not overflow the exponent
+    policy = RetryPolicy(max_backoff=30, jitter=False)
+    assert policy.get_backoff(5000) == 30
+    assert 0 <= RetryPolicy(max_backoff=30).get_backoff(5000) <= 30
+
+
+def test_retry_after_takes_precedence():
+    policy = RetryPolicy(max_backoff=30, jitter=False)
+    assert policy.get_backoff(0, {"Retry-After": "7"}) == 7
+    assert policy.get_backoff(0, {"Retry-After": "600"}) == 30
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from sec_api.utils import iter_json_array
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize(
+    "number, split",
+    [("35000000000.0", "."), ("1.5e10", "e"), ("-2E-3", "E"), ("12345", "3")],
+)
+def test_number_split_at_chunk_boundary(number, split):
+    data = ("[" + number + ", 7]").encode()
+    cut = data.index(split.encode()) + 1
+    items = list(iter_json_array([data[:cut], data[cut:]]))
+    assert items == [json.loads(number), 7]
+
+
+def test_every_chunk_boundary():
+    records = [1, 35000000000.0, -1.25e-7, "a,]", True, None, {"x": [1, 2.5]}, []]
+    data = json.dumps({"total": 8, "data": records}).encode()
+    for size in range(1, len(data) + 1):
+        assert list(iter_json_array(_chunks(data, size), "data")) == records
+
+
+def test_utf8_split_across_chunks():
+    data = json.dumps([{"name": "Société Générale"}], ensure_ascii=False).encode()
+    assert list(iter_json_array(_chunks(data, 1))) == [{"name": "Société Générale"}]
+
+
+def test_key_not_found():
+    assert list(iter_json_array([b'{"other": [1, 2]}'], "data")) == []
+
+
+def test_truncated_input_raises():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([b'[{"a": 1}, {"b": ']))